@@ -1,12 +1,11 @@
 """Command-line interface for EFS Purge."""
 
 import argparse
-import asyncio
 import os
 import sys
 
 from . import __version__
-from .purger import async_main
+from .purger import async_main, run_async, run_sharded
 
 
 def parse_args() -> argparse.Namespace:
@@ -113,6 +112,37 @@ def parse_args() -> argparse.Namespace:
         help="Maximum subdirectories to scan concurrently (lower = less memory, default: 100)",
     )
 
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=int(os.getenv("EFSPURGE_IO_THREADS", "0") or "0") or None,
+        help="Threads for file stat/unlink/rmdir calls (default: scales with max concurrency, 32-1024)",
+    )
+
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        default=os.getenv("EFSPURGE_ADAPTIVE_CONCURRENCY", "").lower() in ("1", "true", "yes"),
+        help="Halve stat/delete concurrency while file I/O latency rises above twice its lowest level, "
+        "and grow it back as latency recovers",
+    )
+
+    parser.add_argument(
+        "--skip-unchanged-dirs",
+        action="store_true",
+        default=os.getenv("EFSPURGE_SKIP_UNCHANGED_DIRS", "").lower() in ("1", "true", "yes"),
+        help="Incremental run: don't stat files in directories unchanged since the last successful run "
+        "(checkpoint stored beside the root; not compatible with --remove-empty-dirs)",
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=int(os.getenv("EFSPURGE_PROCESSES", "1")),
+        help="Split top-level subdirectories across this many worker processes "
+        "(memory limit and empty-dir limit are divided between them)",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -139,24 +169,34 @@ def main() -> None:
             stacklevel=2,
         )
 
+    if args.processes < 1:
+        print(f"Fatal error: --processes must be >= 1, got {args.processes}", file=sys.stderr)
+        sys.exit(1)
+
+    purger_kwargs = {
+        "max_age_days": args.max_age_days,
+        "max_concurrency": args.max_concurrency,
+        "max_concurrency_scanning": args.max_concurrency_scanning,
+        "max_concurrency_deletion": args.max_concurrency_deletion,
+        "dry_run": args.dry_run,
+        "log_level": args.log_level,
+        "memory_limit_mb": args.memory_limit_mb,
+        "task_batch_size": args.task_batch_size,
+        "remove_empty_dirs": args.remove_empty_dirs,
+        "max_empty_dirs_to_delete": args.max_empty_dirs_to_delete,
+        "max_concurrent_subdirs": args.max_concurrent_subdirs,
+        "skip_unchanged_dirs": args.skip_unchanged_dirs,
+        "io_threads": args.io_threads,
+        "adaptive_concurrency": args.adaptive_concurrency,
+    }
+
     try:
-        # Run the async purger
-        asyncio.run(
-            async_main(
-                path=args.path,
-                max_age_days=args.max_age_days,
-                max_concurrency=args.max_concurrency,
-                max_concurrency_scanning=args.max_concurrency_scanning,
-                max_concurrency_deletion=args.max_concurrency_deletion,
-                dry_run=args.dry_run,
-                log_level=args.log_level,
-                memory_limit_mb=args.memory_limit_mb,
-                task_batch_size=args.task_batch_size,
-                remove_empty_dirs=args.remove_empty_dirs,
-                max_empty_dirs_to_delete=args.max_empty_dirs_to_delete,
-                max_concurrent_subdirs=args.max_concurrent_subdirs,
-            )
-        )
+        if args.processes > 1:
+            # Shard top-level subdirectories across worker processes
+            run_sharded(args.path, args.processes, **purger_kwargs)
+        else:
+            # Run the async purger
+            run_async(async_main(path=args.path, **purger_kwargs))
 
         # Exit with success
         sys.exit(0)
@@ -5,6 +5,21 @@ import logging
 import sys
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up (pip install efspurge[orjson])
+    orjson = None
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """Serialize obj to a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits - let the stdlib encoder handle (or reject) it
+    return json.dumps(obj)
+
 
 class JsonFormatter(logging.Formatter):
     """JSON log formatter for Kubernetes and CloudWatch compatibility."""
@@ -27,7 +42,7 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_obj["extra_fields"] = record.extra_fields
 
-        return json.dumps(log_obj)
+        return _dumps(log_obj)
 
 
 def setup_logging(logger_name: str = "efspurge", level: str = "INFO") -> logging.Logger:
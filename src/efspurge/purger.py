@@ -1,37 +1,441 @@
 """Async file purger optimized for AWS EFS and network storage."""
 
 import asyncio
+import errno
+import gc
+import json
 import logging
+import multiprocessing
 import os
 import time
+import warnings
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from enum import IntEnum
 from pathlib import Path
 
-import aiofiles.os
-
 from . import __version__
 from .logging import log_with_context, setup_logging
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is a declared dependency
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# psutil.Process handle for the current process, created on first use.
+# Constructing a Process reads /proc on every call, so reuse it (keyed by pid in case we were forked).
+_process_handle = None
+
+
+def _get_process():
+    """Return a cached psutil.Process for the current process."""
+    global _process_handle
+    if _process_handle is None or _process_handle.pid != os.getpid():
+        _process_handle = psutil.Process()
+    return _process_handle
+
+
+# Linux fast path: /proc/<pid>/statm through a cached fd - one pread per call, no object churn
+# (~1µs vs ~10µs for psutil's open/read/close). getrusage's ru_maxrss is not an option: it is
+# the peak RSS, so back-pressure would never see memory drop again.
+_HAS_STATM = os.path.exists("/proc/self/statm")
+_PAGE_SIZE_MB = os.sysconf("SC_PAGE_SIZE") / 1024 / 1024 if _HAS_STATM else 0.0
+_statm_fd = None
+_statm_pid = None
+
+
+def _statm_rss_mb() -> float:
+    """Read resident set size in MB from /proc statm via a cached fd (reopened after a fork)."""
+    global _statm_fd, _statm_pid
+    pid = os.getpid()
+    if _statm_fd is None or _statm_pid != pid:
+        # /proc/self is resolved at open time, so a forked child must open its own
+        _statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+        _statm_pid = pid
+    return int(os.pread(_statm_fd, 128, 0).split()[1]) * _PAGE_SIZE_MB
+
 
 def get_memory_usage_mb() -> float:
     """Get current memory usage in MB."""
+    if _HAS_STATM:
+        try:
+            return _statm_rss_mb()
+        except (OSError, ValueError, IndexError):
+            pass  # Fall through to psutil
+    if psutil is not None:
+        return _get_process().memory_info().rss / 1024 / 1024  # Convert bytes to MB
+    if resource is not None:
+        # Last resort: peak RSS (never drops), KB to MB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return 0.0  # Can't measure
+
+
+# Process RSS is read at most this often (seconds); calls in between reuse the last sample
+MEMORY_SAMPLE_INTERVAL = 1.0
+
+
+class BackpressureState(IntEnum):
+    """Memory pressure level, from RSS as a fraction of memory_limit_mb (ordered, so states compare)."""
+
+    NORMAL = 0  # below 70%
+    ELEVATED = 1  # 70-85%: bounded work queues shrink by 25%, stat/delete concurrency halved
+    CRITICAL = 2  # 85-95%: bounded work queues halved, back-pressure events counted
+    BLOCKED = 3  # 95%+: bounded work queues down to one slot, empty dir removal stops
+
+
+# Lower bound (fraction of memory_limit_mb) of each state above NORMAL, highest first
+_BACKPRESSURE_THRESHOLDS = (
+    (BackpressureState.BLOCKED, 0.95),
+    (BackpressureState.CRITICAL, 0.85),
+    (BackpressureState.ELEVATED, 0.70),
+)
+
+# Fraction of its full capacity a throttled queue keeps in each state (never below one slot)
+_QUEUE_CAPACITY_FACTORS = {
+    BackpressureState.NORMAL: 1.0,
+    BackpressureState.ELEVATED: 0.75,
+    BackpressureState.CRITICAL: 0.5,
+    BackpressureState.BLOCKED: 0.0,
+}
+
+# Fraction of max_concurrency_scanning/deletion allowed in each state, never below
+# MIN_THROTTLED_CONCURRENCY: in-flight files must keep completing for memory to come back down
+_CONCURRENCY_FACTORS = {
+    BackpressureState.NORMAL: 1.0,
+    BackpressureState.ELEVATED: 0.5,
+    BackpressureState.CRITICAL: 0.5,
+    BackpressureState.BLOCKED: 0.5,
+}
+MIN_THROTTLED_CONCURRENCY = 64
+
+# Adaptive concurrency (opt-in, AIMD as in TCP congestion control): per-file stat/unlink latency
+# is kept as an EWMA and compared every LATENCY_ADJUST_INTERVAL with the lowest EWMA seen so far.
+# Above LATENCY_BACKOFF_RATIO × that baseline the stat/delete limits are halved (down to
+# MIN_LATENCY_FACTOR, and never below MIN_THROTTLED_CONCURRENCY); otherwise they grow back by
+# LATENCY_RECOVERY_STEP. Network filesystems get slower, not faster, past their own parallelism.
+LATENCY_ADJUST_INTERVAL = 5.0
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_BACKOFF_RATIO = 2.0
+LATENCY_RECOVERY_STEP = 0.1
+MIN_LATENCY_FACTOR = 1 / 16
+
+
+class _ResizableSemaphore:
+    """
+    Counting semaphore whose limit can be changed while permits are held.
+
+    asyncio.Semaphore has no supported way to shrink (its _value is internal), so this keeps an
+    explicit counter and parks waiters on an asyncio.Condition. Lowering the limit doesn't touch
+    current holders; new acquirers wait until enough of them release.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._cond = asyncio.Condition()
+        self._waiting = 0
+
+    async def acquire(self) -> None:
+        # Fast path: nothing awaited between the check and the increment, so no lock is needed
+        if self.active < self.limit and not self._waiting:
+            self.active += 1
+            return
+        async with self._cond:
+            self._waiting += 1
+            try:
+                await self._cond.wait_for(lambda: self.active < self.limit)
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter may have consumed
+                if self.active < self.limit:
+                    self._cond.notify(1)
+                raise
+            finally:
+                self._waiting -= 1
+            self.active += 1
+
+    async def release(self) -> None:
+        self.active -= 1
+        if self._waiting:
+            async with self._cond:
+                self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit, waking waiters if it grew."""
+        grew = limit > self.limit
+        self.limit = limit
+        if grew and self._waiting:
+            async with self._cond:
+                self._cond.notify_all()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
+class _ResizableQueue(asyncio.Queue):
+    """
+    FIFO queue whose maxsize can be changed while putters are blocked, and whose head can be peeked.
+
+    asyncio.Queue has no supported way to resize (its _maxsize is internal), so this keeps its own
+    limit and overrides full(), which put() re-checks each time it is woken. Shrinking takes effect
+    on the next put; growing wakes blocked putters for the slots that opened up. Items live in a
+    deque this class owns (through the _init/_put/_get storage hooks), so peek() needn't reach
+    into asyncio.Queue's _queue.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._limit = maxsize
+
+    def _init(self, maxsize: int) -> None:
+        self._items: deque = deque()
+
+    def _put(self, item) -> None:
+        self._items.append(item)
+
+    def _get(self):
+        return self._items.popleft()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def peek(self):
+        """Return the next item get() would return, without removing it (IndexError if empty)."""
+        return self._items[0]
+
+    @property
+    def maxsize(self) -> int:
+        return self._limit
+
+    def full(self) -> bool:
+        return 0 < self._limit <= self.qsize()
+
+    def set_maxsize(self, maxsize: int) -> None:
+        """Change the capacity, waking blocked putters if slots opened up."""
+        self._limit = maxsize
+        free = len(self._putters) if maxsize <= 0 else maxsize - self.qsize()
+        for _ in range(min(free, len(self._putters))):
+            self._wakeup_next(self._putters)
+
+
+# Paths per executor hop when stat-ing a file batch. Each chunk is one thread-pool round-trip
+# instead of one per file; chunks run concurrently so network latency still overlaps.
+# This lstat is the only stat a file gets: on Linux, DirEntry.stat() is the same lstat syscall
+# (readdir only supplies d_type), so calling it during the scan would just serialize the
+# network round-trips inside the scandir thread. Removal needs the mtime first - POSIX has no
+# conditional unlink - so stat + remove cannot be fused into one call.
+SYSCALL_BATCH_SIZE = 32
+
+# Per-file lstat/unlink go through a descriptor for the batch's directory (fstatat/unlinkat), so
+# the kernel resolves one name instead of re-walking every component of the full path. O_PATH
+# opens the directory for lookups only (no read permission needed); platforms without the *at
+# calls keep using full paths.
+_HAS_DIR_FD = os.stat in os.supports_dir_fd and os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+_DIR_FD_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_PATH", 0) | getattr(os, "O_CLOEXEC", 0)
+
+
+@dataclass(slots=True)
+class Stats:
+    """
+    Run statistics.
+
+    Counters are plain slotted attributes, so the hot path does attribute access rather than dict
+    hashing. Item access (stats["files_scanned"], stats.get(...)) is kept for callers written
+    against the old dict.
+    """
+
+    files_scanned: int = 0
+    files_to_purge: int = 0
+    files_purged: int = 0
+    dirs_scanned: int = 0
+    symlinks_skipped: int = 0
+    special_files_skipped: int = 0  # Sockets, FIFOs, device nodes, etc.
+    errors: int = 0
+    bytes_freed: int = 0
+    start_time: float = field(default_factory=time.time)
+    memory_backpressure_events: int = 0
+    empty_dirs_to_delete: int = 0  # Directories that would be deleted (increments in dry-run)
+    empty_dirs_deleted: int = 0  # Directories actually deleted (0 in dry-run)
+    unchanged_dirs_skipped: int = 0  # Directories whose files were skipped (skip_unchanged_dirs)
+
+    def __getitem__(self, key: str):
+        if key not in _STATS_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in _STATS_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _STATS_FIELDS
+
+    def get(self, key: str, default=None):
+        """Return the named statistic, or default if there is no such field."""
+        return getattr(self, key) if key in _STATS_FIELDS else default
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a plain dict."""
+        return asdict(self)
+
+
+_STATS_FIELDS = frozenset(f.name for f in fields(Stats))
+
+
+# Files processed between merges of a batch's local counters into the shared stats
+STATS_FLUSH_FILES = 1000
+
+
+@dataclass(slots=True)
+class _FileCounts:
+    """Per-batch file counters, bumped without awaits or locks and merged into stats in bulk."""
+
+    files_scanned: int = 0
+    files_to_purge: int = 0
+    files_purged: int = 0
+    bytes_freed: int = 0
+    errors: int = 0
+
+
+_FILE_COUNT_FIELDS = tuple(f.name for f in fields(_FileCounts))
+
+
+def _lstat_many(paths: list[str], dir_fds: dict[str, int] | None = None) -> list:
+    """
+    lstat each path, returning the OSError in place of a failed result (runs in a worker thread).
+
+    If dir_fds maps a path's parent directory to an open descriptor, the path is stat-ed by name
+    relative to it.
+    """
+    results = []
+    for path in paths:
+        try:
+            dir_fd = dir_fds.get(os.path.dirname(path)) if dir_fds else None
+            if dir_fd is None:
+                results.append(os.lstat(path))
+            else:
+                results.append(os.stat(os.path.basename(path), dir_fd=dir_fd, follow_symlinks=False))
+        except OSError as e:
+            results.append(e)
+    return results
+
+
+def _open_dir_fds(directories: set[str]) -> dict[str, int]:
+    """Open a lookup-only descriptor per directory, skipping any that fail (runs in a worker thread)."""
+    dir_fds = {}
+    if not _HAS_DIR_FD:
+        return dir_fds
+    for directory in directories:
+        try:
+            dir_fds[directory] = os.open(directory, _DIR_FD_FLAGS)
+        except OSError:
+            pass  # Fall back to full paths for this directory
+    return dir_fds
+
+
+def checkpoint_path(root_path: str | os.PathLike) -> str:
+    """Return where the last-successful-scan checkpoint for root_path lives (beside the root, not in it)."""
+    root = os.path.normpath(os.fspath(root_path))
+    return os.path.join(os.path.dirname(root), f".{os.path.basename(root)}.efspurge-checkpoint.json")
+
+
+def load_checkpoint(path: str) -> float | None:
+    """Return the start time of the last successful scan recorded at path, or None if there isn't one."""
     try:
-        import psutil
+        with open(path, encoding="utf-8") as f:
+            return float(json.load(f)["last_successful_scan"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
-        process = psutil.Process()
-        return process.memory_info().rss / 1024 / 1024  # Convert bytes to MB
-    except ImportError:
-        # If psutil not available, try alternative method
+
+def save_checkpoint(path: str, scan_start: float) -> None:
+    """Record scan_start as the last successful scan (written to a temp file and renamed into place)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"last_successful_scan": scan_start}, f)
+    os.replace(tmp_path, path)
+
+
+def _remove_many(paths: list[str], dir_fds: dict[str, int] | None = None) -> list:
+    """
+    Remove each path, returning None or the OSError it raised per path (runs in a worker thread).
+
+    Paths whose parent directory is in dir_fds are unlinked by name relative to it.
+    """
+    results = []
+    for path in paths:
         try:
-            import resource
+            _remove_file(path, dir_fds.get(os.path.dirname(path)) if dir_fds else None)
+            results.append(None)
+        except OSError as e:
+            results.append(e)
+    return results
+
+
+def _save_checkpoint_or_warn(logger: logging.Logger, path: str, scan_start: float) -> None:
+    """save_checkpoint, logging a warning instead of failing a completed run (the next run just scans everything)."""
+    try:
+        save_checkpoint(path, scan_start)
+    except OSError as e:
+        log_with_context(logger, "warning", "Could not save checkpoint", {"checkpoint_path": path, "error": str(e)})
 
-            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB to MB on Linux
-        except Exception:
-            return 0.0  # Return 0 if we can't measure
 
+def _remove_file(path: str, dir_fd: int | None = None) -> None:
+    """Remove path, by name relative to dir_fd (its parent directory) when one is given."""
+    if dir_fd is None:
+        os.remove(path)
+    else:
+        os.unlink(os.path.basename(path), dir_fd=dir_fd)
 
-async def async_scandir(path: Path, executor: ThreadPoolExecutor | None = None, purger_instance=None):
+
+def _discard_queued(queue: asyncio.Queue) -> None:
+    """Drop every item still waiting in queue, marking each done so join() can return."""
+    while not queue.empty():
+        queue.get_nowait()
+        queue.task_done()
+
+
+def _path_depth(path: str | bytes | os.PathLike) -> int:
+    """Return the depth of path as its separator count (plain str/bytes count, no Path.parts split)."""
+    path = os.fspath(path)
+    return path.count(os.sep.encode() if isinstance(path, bytes) else os.sep)
+
+
+def _list_dir(path: str | os.PathLike) -> list[os.DirEntry]:
+    """Return the entries of path as a list (runs in a worker thread)."""
+    with os.scandir(path) as entries:
+        return list(entries)
+
+
+def _is_empty_dir(path: str | os.PathLike) -> bool:
+    """Return True if path has no entries, reading at most one of them (runs in a worker thread)."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+async def async_is_empty_dir(path: str | os.PathLike, executor: ThreadPoolExecutor | None = None) -> bool:
+    """
+    Async check that a directory is empty.
+
+    Unlike len(await async_scandir(path)) == 0 this stops at the first entry, so a directory
+    full of files costs one getdents buffer and no DirEntry list.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, _is_empty_dir, path)
+
+
+async def async_scandir(path: str | os.PathLike, executor: ThreadPoolExecutor | None = None, purger_instance=None):
     """
     Async wrapper for os.scandir.
 
@@ -44,17 +448,13 @@ async def async_scandir(path: Path, executor: ThreadPoolExecutor | None = None,
     Returns:
         List of directory entries
     """
-    loop = asyncio.get_running_loop()
-    start_time = time.time() if purger_instance else None
-
-    def _scandir():
-        with os.scandir(path) as entries:
-            return list(entries)
+    # Diagnostics are only kept at DEBUG level; otherwise skip the clock reads entirely
+    track = purger_instance is not None and purger_instance.logger.isEnabledFor(logging.DEBUG)
+    start_time = time.time() if track else None
 
-    result = await loop.run_in_executor(executor, _scandir)
+    result = await asyncio.get_running_loop().run_in_executor(executor, _list_dir, path)
 
-    # Track diagnostics (DEBUG level only)
-    if purger_instance and purger_instance.logger.isEnabledFor(logging.DEBUG):
+    if track:
         elapsed = time.time() - start_time
         async with purger_instance.scandir_lock:
             purger_instance.scandir_call_count += 1
@@ -87,7 +487,7 @@ async def _log_scandir_diagnostics(purger_instance, executor, current_time=None)
         else 0
     )
     calls_per_sec = (
-        purger_instance.scandir_call_count / (current_time - (purger_instance.stats.get("start_time", current_time)))
+        purger_instance.scandir_call_count / (current_time - purger_instance.stats.start_time)
         if purger_instance.scandir_call_count > 0
         else 0
     )
@@ -288,6 +688,9 @@ class AsyncEFSPurger:
         remove_empty_dirs: bool = False,
         max_empty_dirs_to_delete: int = 500,
         max_concurrent_subdirs: int = 100,
+        skip_unchanged_dirs: bool = False,
+        io_threads: int | None = None,
+        adaptive_concurrency: bool = False,
     ):
         """
         Initialize the async EFS purger.
@@ -305,6 +708,12 @@ class AsyncEFSPurger:
             remove_empty_dirs: If True, remove empty directories after scanning (post-order)
             max_empty_dirs_to_delete: Maximum empty directories to delete per run (0 = unlimited, default: 500)
             max_concurrent_subdirs: Maximum subdirectories to scan concurrently (lower = less memory, default: 100)
+            skip_unchanged_dirs: If True, don't stat the files of directories whose mtime predates the
+                                 last successful run (see checkpoint_path); incompatible with remove_empty_dirs
+            io_threads: Threads for file/directory syscalls (lstat, unlink, rmdir); default scales with
+                        max concurrency (32-1024)
+            adaptive_concurrency: If True, shrink the stat/delete concurrency limits while file I/O
+                                  latency climbs and grow them back as it recovers
 
         Raises:
             ValueError: If invalid parameters are provided
@@ -320,8 +729,6 @@ class AsyncEFSPurger:
             if max_concurrency < 1:
                 raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
             # Deprecation warning
-            import warnings
-
             warnings.warn(
                 "max_concurrency is deprecated. Use max_concurrency_scanning and max_concurrency_deletion instead. "
                 f"Setting both to {max_concurrency} for backward compatibility.",
@@ -358,6 +765,12 @@ class AsyncEFSPurger:
         if max_concurrent_subdirs < 1:
             raise ValueError(f"max_concurrent_subdirs must be >= 1, got {max_concurrent_subdirs}")
 
+        if io_threads is not None and io_threads < 1:
+            raise ValueError(f"io_threads must be >= 1, got {io_threads}")
+
+        if skip_unchanged_dirs and remove_empty_dirs:
+            raise ValueError("skip_unchanged_dirs cannot be combined with remove_empty_dirs")
+
         # Ensure root_path is absolute
         root_path_obj = Path(root_path)
         if not root_path_obj.is_absolute():
@@ -394,6 +807,10 @@ class AsyncEFSPurger:
                 )
 
         self.root_path = root_path_obj
+        # Traversal works on plain str paths (scandir joins them for us); Path stays at the API edge
+        self._root_str = root_str
+        # Prefix every directory strictly inside root_path starts with (see _is_under_root)
+        self._root_prefix = os.path.join(root_str, "")
         self.max_age_days = max_age_days
         self.cutoff_time = time.time() - (max_age_days * 86400)  # Convert days to seconds
         # Store concurrency limits (for backward compatibility, max_concurrency is the max of both)
@@ -406,14 +823,20 @@ class AsyncEFSPurger:
         self.remove_empty_dirs = remove_empty_dirs
         self.max_empty_dirs_to_delete = max_empty_dirs_to_delete
         self.max_concurrent_subdirs = max_concurrent_subdirs
+        self.skip_unchanged_dirs = skip_unchanged_dirs
+        self.adaptive_concurrency = adaptive_concurrency
+        # Incremental runs: directories not modified since this time keep the same entries as on
+        # the last successful scan, so their files aren't stat-ed again. Loaded in purge().
+        self.checkpoint_path = checkpoint_path(root_str)
+        self._checkpoint_time: float | None = None
+        # Sharded runs leave the checkpoint to run_sharded, which knows when every shard succeeded
+        self.write_checkpoint = True
 
         # Warn if unlimited empty directory deletion is enabled (can cause OOM)
         if self.remove_empty_dirs and self.max_empty_dirs_to_delete == 0:
             # Estimate safe limit based on memory: ~0.1 MB per directory in memory
             # Use 70% of memory limit for safety margin
             estimated_safe_limit = int((self.memory_limit_mb * 0.7) / 0.1) if self.memory_limit_mb > 0 else 50000
-            import warnings
-
             warnings.warn(
                 f"max_empty_dirs_to_delete=0 (unlimited) can cause OOM with large numbers of empty directories. "
                 f"With memory_limit_mb={self.memory_limit_mb}, consider setting max_empty_dirs_to_delete "
@@ -423,20 +846,7 @@ class AsyncEFSPurger:
             )
 
         # Statistics
-        self.stats = {
-            "files_scanned": 0,
-            "files_to_purge": 0,
-            "files_purged": 0,
-            "dirs_scanned": 0,
-            "symlinks_skipped": 0,
-            "special_files_skipped": 0,  # Sockets, FIFOs, device nodes, etc.
-            "errors": 0,
-            "bytes_freed": 0,
-            "start_time": time.time(),
-            "memory_backpressure_events": 0,
-            "empty_dirs_to_delete": 0,  # Directories that would be deleted (increments in dry-run)
-            "empty_dirs_deleted": 0,  # Directories actually deleted (0 in dry-run)
-        }
+        self.stats = Stats()
 
         # Stuck detection: track progress for detecting hangs
         self.last_files_scanned = 0
@@ -445,7 +855,7 @@ class AsyncEFSPurger:
         self.stuck_detection_count = 0  # How many consecutive progress checks showed no change
 
         # Track directories currently being scanned (for diagnostics when stuck)
-        self.active_directories: set[Path] = set()
+        self.active_directories: set[str] = set()
         self.active_directories_lock = asyncio.Lock()
 
         # Track current phase for better progress reporting
@@ -457,16 +867,15 @@ class AsyncEFSPurger:
         # Rate tracking for enhanced metrics
         self.rate_tracker = RateTracker()
 
-        # Track empty directories for post-order deletion
-        # Use set to prevent duplicates from concurrent scans
-        self.empty_dirs: set[Path] = set()
+        # Track empty directories for post-order deletion, mapped to their depth
+        # (precomputed so the deepest-first sort doesn't re-split every path)
+        # Use dict keys to prevent duplicates from concurrent scans
+        self.empty_dirs: dict[str, int] = {}
 
-        # Concurrency control - separate semaphores for scanning and deletion
-        self.scanning_semaphore = asyncio.Semaphore(max_concurrency_scanning)
-        self.deletion_semaphore = asyncio.Semaphore(max_concurrency_deletion)
-        # Semaphore for subdirectory scanning to maintain constant concurrency
-        self.subdir_semaphore = asyncio.Semaphore(max_concurrent_subdirs)
-        self.stats_lock = asyncio.Lock()
+        # Concurrency control - separate semaphores for scanning and deletion, narrowed under
+        # memory pressure (see _resize_concurrency_limits)
+        self.scanning_semaphore = _ResizableSemaphore(max_concurrency_scanning)
+        self.deletion_semaphore = _ResizableSemaphore(max_concurrency_deletion)
 
         # Custom ThreadPoolExecutor for directory scanning to bypass default thread pool limit
         # Default executor has ~32 threads, limiting directory scanning throughput to ~250-300 dirs/sec
@@ -481,6 +890,15 @@ class AsyncEFSPurger:
 
         self.scandir_executor = ThreadPoolExecutor(max_workers=scandir_threads, thread_name_prefix="efspurge-scandir")
 
+        # Dedicated ThreadPoolExecutor for per-file/per-directory syscalls (lstat, unlink, rmdir)
+        # Submitting os.* calls directly avoids aiofiles' wrapper overhead and the shared default
+        # executor. Sized to the semaphore ceiling so threads aren't the real concurrency cap
+        # (each EFS op is ~1ms of waiting); threads are only created on demand. Overridable, since
+        # past the filesystem's own parallelism extra threads only add contention.
+        if io_threads is None:
+            io_threads = min(1024, max(32, self.max_concurrency))
+        self.io_executor = ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="efspurge-io")
+
         # Diagnostics for executor utilization (DEBUG level only)
         self.scandir_call_count = 0
         self.scandir_total_time = 0.0
@@ -495,142 +913,316 @@ class AsyncEFSPurger:
 
         # Logging
         self.logger = setup_logging("efspurge", log_level)
+        # Cached once: guards per-file/per-directory debug logs on the hot path
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
         # Progress tracking
         self.last_progress_log = time.time()
         self.progress_interval = 30  # Log progress every 30 seconds
 
-        # Memory back-pressure tracking
-        self.last_memory_warning = 0  # Track last warning time
-        self.memory_warning_interval = 60  # Only warn once per minute
-        self.memory_check_lock = asyncio.Lock()  # Prevent concurrent checks
+        # Memory back-pressure state machine (see _update_memory_pressure)
+        self.memory_pressure_state = BackpressureState.NORMAL
+        self._memory_sample_mb = 0.0
+        self._last_memory_sample = 0.0
+        # Set while purge() runs: RSS is then sampled only by _memory_sampler()
+        self._memory_sampler_task: asyncio.Task | None = None
+        # Adaptive concurrency (see _adjust_concurrency_for_latency): per-file I/O latency EWMA in
+        # seconds, the lowest EWMA seen, and the fraction of the stat/delete limits currently allowed
+        self._io_latency_ewma: float | None = None
+        self._io_latency_baseline: float | None = None
+        self._latency_factor = 1.0
+        # Bounded queues whose capacity follows the pressure state (queue -> full capacity)
+        self._throttled_queues: dict[_ResizableQueue, int] = {}
+
+        # File-batch pipeline: directory scans produce batches of file paths onto a bounded queue
+        # and a small pool of consumers stats/deletes them. Producers block on put() when the queue
+        # is full, so pending work is capped at file_batch_queue_size × task_batch_size paths
+        # without polling process memory on every batch.
+        self.file_batch_consumers = max(2, max_concurrency_scanning // 256)
+        self.file_batch_queue_size = self.file_batch_consumers * 2
+        self._file_batch_queue: _ResizableQueue | None = None
+        # Directory work queue, set while a scan is running (see _scan_tree)
+        self._dir_queue: asyncio.Queue | None = None
+
+        # Sharded runs (see run_sharded): restrict the scan to these top-level subdirectories.
+        # Only the shard that owns the root scans root-level files.
+        self.shard_dirs: set[str] | None = None
+        self.owns_root = True
+
+    def update_stats(self, **kwargs) -> None:
+        """
+        Add to statistics counters.
 
-    async def update_stats(self, **kwargs) -> None:
-        """Thread-safe update of statistics."""
-        async with self.stats_lock:
-            for key, value in kwargs.items():
-                if key in self.stats:
-                    self.stats[key] += value
+        No lock: everything touching stats runs on the event loop, and nothing here awaits, so an
+        update can't interleave with another coroutine.
+        """
+        stats = self.stats
+        for key, value in kwargs.items():
+            if key in _STATS_FIELDS:
+                setattr(stats, key, getattr(stats, key) + value)
 
-            # Progress logging is handled by _background_progress_reporter()
-            # Removed duplicate logging here to prevent duplicate log entries
+        # Progress logging is handled by _background_progress_reporter()
+        # Removed duplicate logging here to prevent duplicate log entries
 
     async def check_memory_pressure(self) -> tuple[bool, float]:
         """
         Check if memory usage is high and apply back-pressure if needed.
 
-        Uses a lock to prevent concurrent checks and rate-limits warning messages
-        to avoid log spam.
+        Back-pressure is applied by shrinking the bounded work queues (see _update_memory_pressure)
+        rather than by sleeping, so callers blocked on a full queue are what slows the producers.
 
         Returns:
             Tuple of (is_high: bool, memory_mb: float)
-            - is_high: True if memory is above limit (caller should reduce batch sizes)
-            - memory_mb: Current memory usage in MB (for proactive batch size reduction)
+            - is_high: True if memory is at or above the CRITICAL state (caller should reduce batch sizes)
+            - memory_mb: Memory usage in MB at the last sample (for proactive batch size reduction)
         """
         if self.memory_limit_mb <= 0:
             return False, 0.0  # No limit set
 
-        # Use lock to prevent multiple concurrent checks
-        async with self.memory_check_lock:
-            memory_mb = get_memory_usage_mb()
+        state, memory_mb = await self._update_memory_pressure()
+        return state >= BackpressureState.CRITICAL, memory_mb
 
-            # CRITICAL FIX: Trigger back-pressure at 85% threshold to prevent OOM
-            # Memory spikes during asyncio.gather() can push usage from 85% to OOM
-            # before checks can detect it. Triggering at 85% provides safety margin.
-            BACKPRESSURE_THRESHOLD = 0.85  # Trigger at 85% of limit
-            backpressure_threshold_mb = self.memory_limit_mb * BACKPRESSURE_THRESHOLD
-
-            if memory_mb > backpressure_threshold_mb:
-                current_time = time.time()
-
-                # Only log warning once per interval to avoid spam
-                if current_time - self.last_memory_warning >= self.memory_warning_interval:
-                    memory_percent = (memory_mb / self.memory_limit_mb * 100) if self.memory_limit_mb > 0 else 0
-                    self.logger.warning(
-                        f"Memory usage ({memory_mb:.1f} MB, {memory_percent:.1f}%) exceeds back-pressure threshold "
-                        f"({backpressure_threshold_mb:.1f} MB, {BACKPRESSURE_THRESHOLD * 100:.0f}%), "
-                        f"applying back-pressure (logged once per {self.memory_warning_interval}s to avoid spam)..."
-                    )
-                    self.last_memory_warning = current_time
+    async def _update_memory_pressure(self) -> tuple[BackpressureState, float]:
+        """
+        Return the memory pressure (state, memory_mb), cheap enough to call per directory.
 
-                # Track back-pressure event
-                await self.update_stats(memory_backpressure_events=1)
+        During purge() the background _memory_sampler() owns RSS sampling and this only reads its
+        last result, so no worker coroutine ever pays for the read. Outside purge() (scan_directory
+        or _remove_empty_directories called directly) it samples inline, at most once per
+        MEMORY_SAMPLE_INTERVAL.
+        """
+        if self.memory_limit_mb <= 0:
+            return BackpressureState.NORMAL, 0.0
+        if self._memory_sampler_task is not None:
+            return self.memory_pressure_state, self._memory_sample_mb
+
+        now = time.monotonic()
+        if now - self._last_memory_sample < MEMORY_SAMPLE_INTERVAL:
+            return self.memory_pressure_state, self._memory_sample_mb
+        self._last_memory_sample = now
+        return await self._sample_memory_pressure()
+
+    async def _memory_sampler(self) -> None:
+        """Background task that advances the memory pressure state machine every MEMORY_SAMPLE_INTERVAL."""
+        while True:
+            await asyncio.sleep(MEMORY_SAMPLE_INTERVAL)
+            await self._sample_memory_pressure()
 
-                # Apply actual back-pressure: pause briefly and force GC
-                await asyncio.sleep(0.5)  # Shorter pause, but happens under lock
+    async def _sample_memory_pressure(self) -> tuple[BackpressureState, float]:
+        """
+        Read RSS, advance the memory pressure state machine and return (state, memory_mb).
 
-                # Force garbage collection
-                import gc
+        On a state change the throttled queues and the stat/delete concurrency limits are resized
+        and the transition is logged once. Entering CRITICAL runs a generation-0 collection only -
+        a full gc.collect() walks every live object.
+        """
+        memory_mb = get_memory_usage_mb()
+        self._memory_sample_mb = memory_mb
+        memory_fraction = memory_mb / self.memory_limit_mb
+        state = BackpressureState.NORMAL
+        for candidate, threshold in _BACKPRESSURE_THRESHOLDS:
+            if memory_fraction >= threshold:
+                state = candidate
+                break
 
-                gc.collect()
+        previous = self.memory_pressure_state
+        if state != previous:
+            self.memory_pressure_state = state
+            self._resize_throttled_queues()
+            await self._resize_concurrency_limits()
+            if state >= BackpressureState.CRITICAL > previous:
+                gc.collect(0)
+            log_with_context(
+                self.logger,
+                "warning" if state > previous else "info",
+                "Memory pressure state changed",
+                {
+                    "from": previous.name,
+                    "to": state.name,
+                    "memory_mb": round(memory_mb, 1),
+                    "memory_usage_percent": round(memory_fraction * 100, 1),
+                    "queue_capacity_factor": _QUEUE_CAPACITY_FACTORS[state],
+                    "concurrency_factor": _CONCURRENCY_FACTORS[state],
+                },
+            )
 
-                return True, memory_mb  # Memory is high, caller should reduce batch sizes
+        if state >= BackpressureState.CRITICAL:
+            # Counted once per sample, not per call
+            self.update_stats(memory_backpressure_events=1)
+
+        return state, memory_mb
+
+    def _throttle_queue(self, queue: _ResizableQueue) -> None:
+        """Register a bounded queue so its capacity follows the memory pressure state."""
+        self._throttled_queues[queue] = queue.maxsize
+        self._resize_throttled_queues()
+
+    def _resize_throttled_queues(self) -> None:
+        """Set each throttled queue's capacity for the current memory pressure state."""
+        factor = _QUEUE_CAPACITY_FACTORS[self.memory_pressure_state]
+        for queue, capacity in self._throttled_queues.items():
+            queue.set_maxsize(max(1, int(capacity * factor)))
+
+    async def _resize_concurrency_limits(self) -> None:
+        """Set the scanning and deletion semaphore limits for the memory pressure state and I/O latency."""
+        factor = _CONCURRENCY_FACTORS[self.memory_pressure_state] * self._latency_factor
+        for semaphore, full in (
+            (self.scanning_semaphore, self.max_concurrency_scanning),
+            (self.deletion_semaphore, self.max_concurrency_deletion),
+        ):
+            await semaphore.set_limit(max(min(full, MIN_THROTTLED_CONCURRENCY), int(full * factor)))
+
+    def _record_io_latency(self, seconds_per_file: float) -> None:
+        """Fold one file chunk's per-file executor latency into the EWMA."""
+        ewma = self._io_latency_ewma
+        if ewma is None:
+            self._io_latency_ewma = seconds_per_file
+        else:
+            self._io_latency_ewma = ewma + LATENCY_EWMA_ALPHA * (seconds_per_file - ewma)
 
-            return False, memory_mb  # Memory is OK, but return value for proactive reduction
+    async def _latency_controller(self) -> None:
+        """Background task that runs _adjust_concurrency_for_latency() every LATENCY_ADJUST_INTERVAL."""
+        while True:
+            await asyncio.sleep(LATENCY_ADJUST_INTERVAL)
+            await self._adjust_concurrency_for_latency()
 
-    async def process_file(self, file_path: Path) -> None:
+    async def _adjust_concurrency_for_latency(self) -> None:
         """
-        Process a single file - check age and purge if necessary.
-
-        Args:
-            file_path: Path to the file to process
+        One AIMD step: halve the stat/delete limits while the latency EWMA is above
+        LATENCY_BACKOFF_RATIO × its lowest value so far, otherwise grow them by LATENCY_RECOVERY_STEP.
         """
-        # Track active tasks for concurrency metrics
-        async with self.active_tasks_lock:
-            self.active_tasks += 1
-            self.max_active_tasks = max(self.max_active_tasks, self.active_tasks)
+        latency = self._io_latency_ewma
+        if latency is None:
+            return  # No file chunk has completed yet
+        if self._io_latency_baseline is None or latency < self._io_latency_baseline:
+            self._io_latency_baseline = latency
+
+        previous = self._latency_factor
+        if latency > self._io_latency_baseline * LATENCY_BACKOFF_RATIO:
+            factor = max(MIN_LATENCY_FACTOR, previous / 2)
+        else:
+            factor = min(1.0, previous + LATENCY_RECOVERY_STEP)
+        if factor == previous:
+            return
 
-        try:
-            # Use scanning semaphore for stat operation
-            async with self.scanning_semaphore:
-                try:
-                    # Get file stats asynchronously
-                    stat = await aiofiles.os.stat(file_path)
-                    await self.update_stats(files_scanned=1)
-                    # Record sample for rate tracking
-                    self.rate_tracker.record(self.current_phase, "files", 1)
-
-                    # Check if file is old enough to purge
-                    if stat.st_mtime < self.cutoff_time:
-                        await self.update_stats(files_to_purge=1)
-
-                        if not self.dry_run:
-                            # Use deletion semaphore for remove operation
-                            async with self.deletion_semaphore:
-                                # Delete the file
-                                await aiofiles.os.remove(file_path)
-                                await self.update_stats(files_purged=1, bytes_freed=stat.st_size)
-                                # Record deletion sample (use "deletion" phase for purged files)
-                                self.rate_tracker.record("deletion", "files", 1)
-                                self.logger.debug(f"Purged: {file_path}")
-                        else:
-                            self.logger.debug(f"Would purge: {file_path}")
+        self._latency_factor = factor
+        await self._resize_concurrency_limits()
+        log_with_context(
+            self.logger,
+            "info",
+            "Adjusted concurrency for I/O latency",
+            {
+                "latency_ms": round(latency * 1000, 3),
+                "baseline_latency_ms": round(self._io_latency_baseline * 1000, 3),
+                "latency_factor": round(factor, 3),
+                "scanning_limit": self.scanning_semaphore.limit,
+                "deletion_limit": self.deletion_semaphore.limit,
+            },
+        )
 
-                except FileNotFoundError:
-                    # File was deleted by another process - not an error
-                    self.logger.debug(f"File already deleted: {file_path}")
-                except PermissionError as e:
-                    log_with_context(
-                        self.logger,
-                        "warning",
-                        "Permission denied",
-                        {"file": str(file_path), "error": str(e)},
-                    )
-                    await self.update_stats(errors=1)
-                except Exception as e:
-                    log_with_context(
-                        self.logger,
-                        "error",
-                        "Error processing file",
-                        {"file": str(file_path), "error": str(e), "error_type": type(e).__name__},
-                    )
-                    await self.update_stats(errors=1)
+    def _record_file_error(self, file_path: str, error: Exception, counts: _FileCounts) -> None:
+        """Log a failed stat/remove of file_path and count it (a file deleted by another process isn't an error)."""
+        if isinstance(error, FileNotFoundError):
+            if self._debug_enabled:
+                self.logger.debug("File already deleted: %s", file_path)
+            return
+        if isinstance(error, PermissionError):
+            log_with_context(
+                self.logger,
+                "warning",
+                "Permission denied",
+                {"file": str(file_path), "error": str(error)},
+            )
+        else:
+            log_with_context(
+                self.logger,
+                "error",
+                "Error processing file",
+                {"file": str(file_path), "error": str(error), "error_type": type(error).__name__},
+            )
+        counts.errors += 1
+
+    async def _process_file_chunk(self, chunk: list[str], dir_fds: dict[str, int], counts: _FileCounts) -> None:
+        """
+        Stat, age-check and (unless dry_run) remove up to SYSCALL_BATCH_SIZE files.
+
+        The caller acquires a scanning_semaphore permit for this chunk; it is released as soon as
+        the lstat hop returns. Unless dry_run, the chunk's old files are then unlinked in one more
+        hop under a single deletion_semaphore permit - chunks with nothing to remove never take
+        one, so deletion concurrency doesn't cap scanning. The results are tallied in a plain
+        loop - no coroutine, semaphore or try/except per file, since failures come back as their
+        OSError.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            started = time.monotonic()
+            stats = await loop.run_in_executor(self.io_executor, _lstat_many, chunk, dir_fds)
         finally:
-            # Decrement active tasks counter
-            async with self.active_tasks_lock:
-                self.active_tasks -= 1
+            await self.scanning_semaphore.release()
+        self._record_io_latency((time.monotonic() - started) / len(chunk))
+
+        cutoff_time = self.cutoff_time
+        dry_run = self.dry_run
+        debug = self._debug_enabled
+        to_remove: list[tuple[str, int]] = []
+        for path, stat in zip(chunk, stats, strict=True):
+            if isinstance(stat, OSError):
+                self._record_file_error(path, stat, counts)
+                continue
+            counts.files_scanned += 1
+            if stat.st_mtime < cutoff_time:
+                counts.files_to_purge += 1
+                if dry_run:
+                    if debug:
+                        self.logger.debug("Would purge: %s", path)
+                else:
+                    to_remove.append((path, stat.st_size))
 
-    async def _check_empty_directory(self, directory: Path) -> None:
+        if to_remove:
+            async with self.deletion_semaphore:
+                errors = await loop.run_in_executor(
+                    self.io_executor, _remove_many, [path for path, _ in to_remove], dir_fds
+                )
+            for (path, size), error in zip(to_remove, errors, strict=True):
+                if error is None:
+                    counts.files_purged += 1
+                    counts.bytes_freed += size
+                    if debug:
+                        self.logger.debug("Purged: %s", path)
+                else:
+                    self._record_file_error(path, error, counts)
+
+        if counts.files_scanned >= STATS_FLUSH_FILES:
+            self._flush_file_counts(counts)
+
+    def _flush_file_counts(self, counts: _FileCounts) -> None:
+        """Merge batch counters into stats and the rate tracker, then zero them."""
+        deltas = {name: getattr(counts, name) for name in _FILE_COUNT_FIELDS}
+        if not any(deltas.values()):
+            return
+        # Nothing awaits between reading and zeroing, so no chunk's increments can be lost in between
+        for name in _FILE_COUNT_FIELDS:
+            setattr(counts, name, 0)
+
+        self.update_stats(**deltas)
+        # Record samples for rate tracking (deletions use the "deletion" phase)
+        if deltas["files_scanned"]:
+            self.rate_tracker.record(self.current_phase, "files", deltas["files_scanned"])
+        if deltas["files_purged"]:
+            self.rate_tracker.record("deletion", "files", deltas["files_purged"])
+
+    def _is_under_root(self, directory: str) -> bool:
+        """
+        Check whether directory is strictly inside root_path (so never the root itself).
+
+        Every directory we collect is built by joining entry names onto root_path and symlinks
+        are never followed, so a prefix test is equivalent to comparing resolved paths without
+        the per-call lstat walk of Path.resolve(). The root is excluded explicitly: for root "/"
+        the prefix is the root itself.
+        """
+        return directory != self._root_str and directory.startswith(self._root_prefix)
+
+    async def _check_empty_directory(self, directory: str) -> None:
         """
         Check if directory is empty and add to deletion set if so.
 
@@ -640,43 +1232,33 @@ class AsyncEFSPurger:
         Args:
             directory: Directory path to check
         """
-        # Normalize paths for comparison (handle symlinks, relative paths, etc.)
-        try:
-            dir_resolved = directory.resolve()
-            root_resolved = self.root_path.resolve()
-        except (OSError, RuntimeError):
-            # If resolve fails (e.g., broken symlink), use original paths
-            dir_resolved = directory
-            root_resolved = self.root_path
-
         # Never delete root directory
-        if dir_resolved == root_resolved:
+        if not self._is_under_root(directory):
             return
 
-        # Lock entire check-and-add operation to prevent race conditions
-        async with self.stats_lock:
-            # Double-check directory is still empty (might have been populated)
-            # This check happens under lock to prevent race conditions
-            try:
-                entries = await async_scandir(directory, self.scandir_executor, self)
-                if len(entries) == 0:
-                    # Directory is empty, add to deletion set
-                    # Set automatically prevents duplicates from concurrent scans
-                    self.empty_dirs.add(directory)
-                    self.logger.debug(f"Found empty directory: {directory}")
-            except (FileNotFoundError, PermissionError):
-                # Directory was deleted or permission denied - ignore
-                pass
-            except Exception as e:
-                # Log but don't fail
-                self.logger.debug(f"Error checking empty directory {directory}: {e}")
+        # Double-check directory is still empty (might have been populated). Each directory is
+        # checked by the one worker that scanned it, so concurrent checks never share a key.
+        try:
+            if await async_is_empty_dir(directory, self.scandir_executor):
+                # Directory is empty, add to deletion set
+                # Dict keys automatically prevent duplicates from concurrent scans
+                self.empty_dirs[directory] = _path_depth(directory)
+                if self._debug_enabled:
+                    self.logger.debug("Found empty directory: %s", directory)
+        except (FileNotFoundError, PermissionError):
+            # Directory was deleted or permission denied - ignore
+            pass
+        except Exception as e:
+            # Log but don't fail
+            self.logger.debug("Error checking empty directory %s: %s", directory, e)
 
     async def _remove_empty_directories(self) -> None:
         """
         Remove empty directories in post-order (children before parents).
 
         This ensures we can delete nested empty directories correctly.
-        After deleting a directory, we check if its parent is now empty.
+        After deleting a directory, its parent is queued for removal; rmdir refuses it with
+        ENOTEMPTY while anything is left in it, so parents are never listed.
 
         Uses concurrent processing with deletion_semaphore for high throughput.
         Processes directories in batches to maintain memory efficiency.
@@ -689,8 +1271,7 @@ class AsyncEFSPurger:
         self.rate_tracker.set_phase_start("removing_empty_dirs")
 
         # Log start of empty directory removal
-        async with self.stats_lock:
-            empty_dir_count = len(self.empty_dirs)
+        empty_dir_count = len(self.empty_dirs)
         log_with_context(
             self.logger,
             "info",
@@ -698,27 +1279,23 @@ class AsyncEFSPurger:
             {"empty_dirs_found": empty_dir_count},
         )
 
-        # Get initial set of empty directories (copy under lock)
-        async with self.stats_lock:
-            initial_empty_dirs = set(self.empty_dirs)
-
-        # Normalize root path for comparison
-        try:
-            root_resolved = self.root_path.resolve()
-        except (OSError, RuntimeError):
-            root_resolved = self.root_path
+        # Get initial set of empty directories (copy - the cascade adds to empty_dirs)
+        initial_empty_dirs = dict(self.empty_dirs)
 
         # Sort directories by depth (deepest first) for post-order deletion
         # This ensures children are deleted before parents
-        sorted_dirs = sorted(initial_empty_dirs, key=lambda p: len(p.parts), reverse=True)
+        # Depths are precomputed (path -> depth), so the sort key is a dict lookup
+        sorted_dirs = sorted(initial_empty_dirs, key=initial_empty_dirs.__getitem__, reverse=True)
+        del initial_empty_dirs
 
         # Use a lock to protect shared state during concurrent processing
         processed_dirs_lock = asyncio.Lock()
         processed_dirs = set()  # Track which dirs we've processed
-        new_empty_parents_lock = asyncio.Lock()
-        new_empty_parents = set()  # Track parents that become empty
+        # Parents that may have become empty (path -> depth). Workers add to it directly; only the
+        # event loop touches it and no add awaits mid-way, so it needs no lock.
+        new_empty_parents: dict[str, int] = {}
 
-        async def remove_single_directory(directory: Path) -> Path | None:
+        async def remove_single_directory(directory: str) -> str | None:
             """Remove a single empty directory and return its parent if it becomes empty."""
             # Check if already processed
             async with processed_dirs_lock:
@@ -729,75 +1306,62 @@ class AsyncEFSPurger:
             # Check rate limit atomically and increment if under limit (atomic check-and-increment)
             # This prevents race conditions where multiple workers pass the check before any increment
             if self.max_empty_dirs_to_delete > 0:
-                async with self.stats_lock:
-                    to_delete_count = self.stats.get("empty_dirs_to_delete", 0)
-                    if to_delete_count >= self.max_empty_dirs_to_delete:
-                        return None
-                    # Atomically increment counter while holding lock to prevent race condition
-                    self.stats["empty_dirs_to_delete"] = to_delete_count + 1
+                to_delete_count = self.stats.empty_dirs_to_delete
+                if to_delete_count >= self.max_empty_dirs_to_delete:
+                    return None
+                # Check and increment with no await in between, so concurrent removals can't overshoot
+                self.stats.empty_dirs_to_delete = to_delete_count + 1
 
             try:
-                # Normalize directory path for comparison
-                try:
-                    dir_resolved = directory.resolve()
-                except (OSError, RuntimeError):
-                    dir_resolved = directory
-
                 # Never delete root directory
-                if dir_resolved == root_resolved:
+                if not self._is_under_root(directory):
                     # Decrement counter if we're not processing (root protection)
                     if self.max_empty_dirs_to_delete > 0:
-                        async with self.stats_lock:
-                            self.stats["empty_dirs_to_delete"] = max(0, self.stats.get("empty_dirs_to_delete", 0) - 1)
+                        self.stats.empty_dirs_to_delete = max(0, self.stats.empty_dirs_to_delete - 1)
                     return None
 
                 # Perform deletion (semaphore only for actual rmdir, not for checks)
                 # Skip redundant empty check - we already know directory is empty from scanning
                 if not self.dry_run:
                     async with self.deletion_semaphore:
-                        await aiofiles.os.rmdir(directory)
+                        await asyncio.get_running_loop().run_in_executor(self.io_executor, os.rmdir, directory)
                     # Counter already incremented above, just update deleted count
-                    await self.update_stats(empty_dirs_deleted=1)
+                    self.update_stats(empty_dirs_deleted=1)
                     # Record sample for rate tracking
                     self.rate_tracker.record("removing_empty_dirs", "dirs", 1)
-                    self.logger.debug(f"Removed empty directory: {directory}")
+                    if self._debug_enabled:
+                        self.logger.debug("Removed empty directory: %s", directory)
                 else:
                     # Dry run: counter already incremented above, just log
-                    self.logger.debug(f"Would remove empty directory: {directory}")
+                    if self._debug_enabled:
+                        self.logger.debug("Would remove empty directory: %s", directory)
 
-                # After deleting, check if parent is now empty (outside semaphore for better concurrency)
-                parent = directory.parent
-                if parent != directory:
-                    try:
-                        parent_resolved = parent.resolve()
-                        if parent_resolved != root_resolved:
-                            # Check if parent is now empty (quick check without holding semaphore)
-                            parent_entries = await async_scandir(parent, self.scandir_executor, self)
-                            if len(parent_entries) == 0:
-                                return parent  # Parent is now empty
-                    except (FileNotFoundError, PermissionError, OSError, RuntimeError):
-                        pass  # Parent doesn't exist, no permission, or resolve failed
+                # After deleting, hand the parent to the cascade without listing it: its rmdir fails
+                # with ENOTEMPTY if anything is left, which is one syscall instead of scandir + rmdir.
+                # A dry run deletes nothing, so no parent can have become empty.
+                parent = os.path.dirname(directory)
+                if not self.dry_run and self._is_under_root(parent):
+                    return parent
 
             except FileNotFoundError:
                 # Directory was already deleted by another process
                 # Decrement counter since we didn't actually delete it
                 if self.max_empty_dirs_to_delete > 0:
-                    async with self.stats_lock:
-                        self.stats["empty_dirs_to_delete"] = max(0, self.stats.get("empty_dirs_to_delete", 0) - 1)
-                self.logger.debug(f"Empty directory already deleted: {directory}")
+                    self.stats.empty_dirs_to_delete = max(0, self.stats.empty_dirs_to_delete - 1)
+                if self._debug_enabled:
+                    self.logger.debug("Empty directory already deleted: %s", directory)
             except OSError as e:
                 # Directory might have been populated or permission denied
                 # Decrement counter since we didn't actually delete it
                 if self.max_empty_dirs_to_delete > 0:
-                    async with self.stats_lock:
-                        self.stats["empty_dirs_to_delete"] = max(0, self.stats.get("empty_dirs_to_delete", 0) - 1)
+                    self.stats.empty_dirs_to_delete = max(0, self.stats.empty_dirs_to_delete - 1)
                 log_with_context(
                     self.logger,
                     "warning",
                     "Could not remove empty directory",
                     {"directory": str(directory), "error": str(e)},
                 )
-                await self.update_stats(errors=1)
+                self.update_stats(errors=1)
 
             return None
 
@@ -815,35 +1379,29 @@ class AsyncEFSPurger:
         # Queue size limited to semaphore limit + small buffer to prevent memory growth
         # This ensures memory is bounded by semaphore, not by total directories
         queue_maxsize = self.max_concurrency_deletion + 100  # Small buffer for queue
-        directory_queue = asyncio.Queue(maxsize=queue_maxsize)
-        results_queue = asyncio.Queue()
-        stop_event = asyncio.Event()
+        directory_queue = _ResizableQueue(maxsize=queue_maxsize)
+        self._throttle_queue(directory_queue)
         processed_count = 0
         exceptions_count = 0
+        new_parents_collected = 0
 
         async def worker():
-            """Worker that processes directories from queue, respecting semaphore limit."""
-            nonlocal processed_count, exceptions_count
-            while not stop_event.is_set():
+            """Worker that removes directories from the queue until cancelled (rmdir holds a semaphore slot)."""
+            nonlocal processed_count, exceptions_count, new_parents_collected
+            while True:
+                directory = await directory_queue.get()
                 try:
-                    # Get directory from queue with timeout to check stop_event
-                    directory = await asyncio.wait_for(directory_queue.get(), timeout=1.0)
-
-                    # Process directory (semaphore limits concurrent operations)
-                    result = await remove_single_directory(directory)
-
-                    # Put result in results queue
-                    await results_queue.put(result)
-                    directory_queue.task_done()
+                    parent = await remove_single_directory(directory)
                     processed_count += 1
-
-                except asyncio.TimeoutError:
-                    # Timeout allows checking stop_event
-                    continue
+                    # Siblings return the same parent, so only count it once
+                    if parent is not None and parent not in new_empty_parents:
+                        new_empty_parents[parent] = _path_depth(parent)
+                        new_parents_collected += 1
                 except Exception as e:
                     exceptions_count += 1
-                    self.logger.debug(f"Exception in worker: {e}", exc_info=e)
-                    await self.update_stats(errors=1)
+                    self.logger.debug("Exception in worker: %s", e, exc_info=e)
+                    self.update_stats(errors=1)
+                finally:
                     directory_queue.task_done()
 
         # Start workers (number limited by semaphore - workers wait for semaphore slots)
@@ -863,102 +1421,55 @@ class AsyncEFSPurger:
                 # Circuit breaker: Stop if memory is critical
                 memory_percent = (current_memory_mb / self.memory_limit_mb * 100) if self.memory_limit_mb > 0 else 0
                 if memory_percent > CRITICAL_MEMORY_THRESHOLD * 100:
-                    async with self.stats_lock:
-                        deleted_count = self.stats.get("empty_dirs_deleted", 0)
+                    deleted_count = self.stats.empty_dirs_deleted
                     self.logger.error(
                         f"CRITICAL: Memory usage ({memory_percent:.1f}%, {current_memory_mb:.1f} MB) exceeds "
                         f"critical threshold ({CRITICAL_MEMORY_THRESHOLD * 100:.0f}%). "
                         f"Stopping empty directory deletion to prevent OOM. "
                         f"Processed {i} directories, deleted {deleted_count} before stopping."
                     )
-                    stop_event.set()
+                    # Drop what's still queued so only the removals already running finish
+                    _discard_queued(directory_queue)
                     break
 
                 # Check rate limit
                 if self.max_empty_dirs_to_delete > 0:
-                    async with self.stats_lock:
-                        to_delete_count = self.stats.get("empty_dirs_to_delete", 0)
-                        if to_delete_count >= self.max_empty_dirs_to_delete:
-                            unprocessed_count = len(sorted_dirs) - i  # noqa: F821
-                            log_with_context(
-                                self.logger,
-                                "info",
-                                "Rate limit reached for empty directory deletion",
-                                {
-                                    "max_empty_dirs_to_delete": self.max_empty_dirs_to_delete,
-                                    "empty_dirs_to_delete": to_delete_count,
-                                    "unprocessed_dirs_in_batch": unprocessed_count,
-                                },
-                            )
-                            stop_event.set()
-                            break
+                    to_delete_count = self.stats.empty_dirs_to_delete
+                    if to_delete_count >= self.max_empty_dirs_to_delete:
+                        unprocessed_count = len(sorted_dirs) - i  # noqa: F821
+                        log_with_context(
+                            self.logger,
+                            "info",
+                            "Rate limit reached for empty directory deletion",
+                            {
+                                "max_empty_dirs_to_delete": self.max_empty_dirs_to_delete,
+                                "empty_dirs_to_delete": to_delete_count,
+                                "unprocessed_dirs_in_batch": unprocessed_count,
+                            },
+                        )
+                        break
 
                 # Add directory to queue (will block if queue is full, preventing memory growth)
                 # Queue size is bounded, so memory is controlled
-                try:
-                    await directory_queue.put(sorted_dirs[i])  # noqa: F821
-                    i += 1
-                except Exception:
-                    # Queue closed or error
-                    break
+                await directory_queue.put(sorted_dirs[i])  # noqa: F821
+                i += 1
 
-        # Start producer
-        producer_task = asyncio.create_task(producer())
-
-        # Collect results as they complete
-        new_parents_collected = 0
-        while True:
-            # Check if we're done (producer finished and queue empty)
-            if producer_task.done() and directory_queue.empty() and results_queue.empty():
-                # Wait a bit for any remaining work
-                await asyncio.sleep(0.1)
-                if directory_queue.empty() and results_queue.empty():
-                    break
-
-            # Get result from queue (with timeout to check completion)
-            try:
-                result = await asyncio.wait_for(results_queue.get(), timeout=1.0)
-
-                if isinstance(result, Exception):
-                    exceptions_count += 1
-                    self.logger.debug(f"Exception during directory deletion: {result}", exc_info=result)
-                    await self.update_stats(errors=1)
-                elif result is not None:  # Parent became empty
-                    async with new_empty_parents_lock:
-                        new_empty_parents.add(result)
-                    new_parents_collected += 1
-
-                results_queue.task_done()
-
-            except asyncio.TimeoutError:
-                # Check if producer is done and queue is empty
-                if producer_task.done() and directory_queue.empty():
-                    # Wait a bit more for workers to finish
-                    await asyncio.sleep(0.5)
-                    if results_queue.empty():
-                        break
-                continue
-
-        # Wait for producer to complete
+        # The producer returns once everything is queued (or it stopped early); join() then waits
+        # for the workers to finish what's queued, with no result queue or timeout polling
         try:
-            await producer_task
-        except Exception as e:
-            self.logger.debug(f"Producer exception: {e}", exc_info=e)
-
-        # Signal workers to stop
-        stop_event.set()
-
-        # Wait for workers to finish current work
-        await directory_queue.join()  # Wait for all tasks to be processed
-
-        # Cancel workers
-        for worker_task in workers:
-            worker_task.cancel()
-        await asyncio.gather(*workers, return_exceptions=True)
+            try:
+                await producer()
+            except Exception as e:
+                self.logger.debug("Producer exception: %s", e, exc_info=e)
+            await directory_queue.join()
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._throttled_queues.pop(directory_queue, None)
 
         # Log progress after first pass
-        async with self.stats_lock:
-            deleted_count = self.stats.get("empty_dirs_deleted", 0)
+        deleted_count = self.stats.empty_dirs_deleted
         log_with_context(
             self.logger,
             "info",
@@ -982,29 +1493,27 @@ class AsyncEFSPurger:
         while new_empty_parents:
             iteration += 1
             # Get next batch of parents to process
-            async with new_empty_parents_lock:
-                # Limit batch size to prevent memory explosion during cascading deletion
-                # Process in chunks if there are too many parents
-                # Increased from 2k to 5k for better performance (still prevents memory spikes)
-                max_parents_per_iteration = 5000  # Process max 5k parents per iteration
-                if len(new_empty_parents) > max_parents_per_iteration:
-                    # Take a subset and keep the rest for next iteration
-                    parents_list = sorted(new_empty_parents, key=lambda p: len(p.parts), reverse=True)
-                    parents_to_process = parents_list[:max_parents_per_iteration]
-                    new_empty_parents = set(parents_list[max_parents_per_iteration:])
-                    del parents_list  # Free memory
-                else:
-                    parents_to_process = sorted(new_empty_parents, key=lambda p: len(p.parts), reverse=True)
-                    new_empty_parents = set()  # Reset for next iteration
+            # Limit batch size to prevent memory explosion during cascading deletion
+            # Process in chunks if there are too many parents
+            # Increased from 2k to 5k for better performance (still prevents memory spikes)
+            max_parents_per_iteration = 5000  # Process max 5k parents per iteration
+            if len(new_empty_parents) > max_parents_per_iteration:
+                # Take a subset and keep the rest for next iteration
+                parents_list = sorted(new_empty_parents, key=new_empty_parents.__getitem__, reverse=True)
+                parents_to_process = parents_list[:max_parents_per_iteration]
+                new_empty_parents = {p: new_empty_parents[p] for p in parents_list[max_parents_per_iteration:]}
+                del parents_list  # Free memory
+            else:
+                parents_to_process = sorted(new_empty_parents, key=new_empty_parents.__getitem__, reverse=True)
+                new_empty_parents = {}  # Reset for next iteration
 
             if not parents_to_process:
                 break
 
             # Log progress periodically
             if iteration % 10 == 0 or len(parents_to_process) > 1000:
-                async with self.stats_lock:
-                    to_delete_count = self.stats.get("empty_dirs_to_delete", 0)
-                    deleted_count = self.stats.get("empty_dirs_deleted", 0)
+                to_delete_count = self.stats.empty_dirs_to_delete
+                deleted_count = self.stats.empty_dirs_deleted
                 log_with_context(
                     self.logger,
                     "info",
@@ -1023,8 +1532,7 @@ class AsyncEFSPurger:
 
             # Circuit breaker: Stop if memory is critical
             if memory_percent > CRITICAL_MEMORY_THRESHOLD * 100:
-                async with self.stats_lock:
-                    deleted_count = self.stats.get("empty_dirs_deleted", 0)
+                deleted_count = self.stats.empty_dirs_deleted
                 self.logger.error(
                     f"CRITICAL: Memory usage ({memory_percent:.1f}%, {current_memory_mb:.1f} MB) exceeds "
                     f"critical threshold ({CRITICAL_MEMORY_THRESHOLD * 100:.0f}%) during cascading deletion. "
@@ -1034,23 +1542,22 @@ class AsyncEFSPurger:
 
             # Check rate limit before processing
             if self.max_empty_dirs_to_delete > 0:
-                async with self.stats_lock:
-                    to_delete_count = self.stats.get("empty_dirs_to_delete", 0)
-                    if to_delete_count >= self.max_empty_dirs_to_delete:
-                        unprocessed_count = len(parents_to_process)
-                        log_with_context(
-                            self.logger,
-                            "info",
-                            "Rate limit reached during cascading deletion",
-                            {
-                                "max_empty_dirs_to_delete": self.max_empty_dirs_to_delete,
-                                "empty_dirs_to_delete": to_delete_count,
-                                "unprocessed_parents_in_batch": unprocessed_count,
-                            },
-                        )
-                        break
+                to_delete_count = self.stats.empty_dirs_to_delete
+                if to_delete_count >= self.max_empty_dirs_to_delete:
+                    unprocessed_count = len(parents_to_process)
+                    log_with_context(
+                        self.logger,
+                        "info",
+                        "Rate limit reached during cascading deletion",
+                        {
+                            "max_empty_dirs_to_delete": self.max_empty_dirs_to_delete,
+                            "empty_dirs_to_delete": to_delete_count,
+                            "unprocessed_parents_in_batch": unprocessed_count,
+                        },
+                    )
+                    break
 
-            async def remove_parent_directory(parent: Path) -> Path | None:
+            async def remove_parent_directory(parent: str) -> str | None:
                 """Remove a single empty parent directory and return grandparent if it becomes empty."""
                 # Check if already processed
                 async with processed_dirs_lock:
@@ -1059,141 +1566,96 @@ class AsyncEFSPurger:
                     processed_dirs.add(parent)
 
                 try:
-                    # Normalize parent path
-                    try:
-                        parent_resolved = parent.resolve()
-                    except (OSError, RuntimeError):
-                        parent_resolved = parent
-
                     # Never delete root directory
-                    if parent_resolved == root_resolved:
+                    if not self._is_under_root(parent):
                         return None
 
                     # Skip redundant empty check - we know parent is empty (it's in the empty parents set)
                     # Only hold semaphore for actual deletion, not for checks
                     if not self.dry_run:
                         async with self.deletion_semaphore:
-                            await aiofiles.os.rmdir(parent)
-                        await self.update_stats(empty_dirs_to_delete=1, empty_dirs_deleted=1)
+                            await asyncio.get_running_loop().run_in_executor(self.io_executor, os.rmdir, parent)
+                        self.update_stats(empty_dirs_to_delete=1, empty_dirs_deleted=1)
                         # Record sample for rate tracking
                         self.rate_tracker.record("removing_empty_dirs", "dirs", 1)
-                        self.logger.debug(f"Removed empty parent directory: {parent}")
+                        if self._debug_enabled:
+                            self.logger.debug("Removed empty parent directory: %s", parent)
                     else:
-                        await self.update_stats(empty_dirs_to_delete=1)
-                        self.logger.debug(f"Would remove empty parent directory: {parent}")
-
-                    # Check if parent's parent is now empty (cascading) - outside semaphore for better concurrency
-                    grandparent = parent.parent
-                    if grandparent != parent:
-                        try:
-                            grandparent_resolved = grandparent.resolve()
-                            if grandparent_resolved != root_resolved:
-                                grandparent_entries = await async_scandir(grandparent, self.scandir_executor, self)
-                                if len(grandparent_entries) == 0:
-                                    return grandparent  # Grandparent is now empty
-                        except (FileNotFoundError, PermissionError, OSError, RuntimeError):
-                            pass
+                        self.update_stats(empty_dirs_to_delete=1)
+                        if self._debug_enabled:
+                            self.logger.debug("Would remove empty parent directory: %s", parent)
+
+                    # Cascade to the grandparent the same way - its rmdir tells us whether it's empty
+                    grandparent = os.path.dirname(parent)
+                    if not self.dry_run and self._is_under_root(grandparent):
+                        return grandparent
 
                 except FileNotFoundError:
-                    self.logger.debug(f"Empty parent directory already deleted: {parent}")
+                    if self._debug_enabled:
+                        self.logger.debug("Empty parent directory already deleted: %s", parent)
                 except OSError as e:
+                    if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                        # Parents are queued speculatively, so this just means a sibling is still there.
+                        # Forget it so the removal of its last child can queue it again.
+                        async with processed_dirs_lock:
+                            processed_dirs.discard(parent)
+                        return None
                     log_with_context(
                         self.logger,
                         "warning",
                         "Could not remove empty parent directory",
                         {"directory": str(parent), "error": str(e)},
                     )
-                    await self.update_stats(errors=1)
+                    self.update_stats(errors=1)
 
                 return None
 
             # Use semaphore+queue pattern for cascading deletion (same as first pass)
             # Memory bounded by semaphore limit, not batch size
             queue_maxsize = self.max_concurrency_deletion + 100
-            parent_queue = asyncio.Queue(maxsize=queue_maxsize)
-            results_queue = asyncio.Queue()
-            stop_event = asyncio.Event()
+            parent_queue = _ResizableQueue(maxsize=queue_maxsize)
+            self._throttle_queue(parent_queue)
             processed_count = 0
             exceptions_count = 0
+            new_grandparents_collected = 0
 
             async def parent_worker():
-                """Worker that processes parent directories from queue, respecting semaphore limit."""
-                nonlocal processed_count, exceptions_count
-                while not stop_event.is_set():
+                """Worker that removes parent directories from the queue until cancelled."""
+                nonlocal processed_count, exceptions_count, new_grandparents_collected
+                while True:
+                    parent = await parent_queue.get()
                     try:
-                        parent = await asyncio.wait_for(parent_queue.get(), timeout=1.0)
-                        result = await remove_parent_directory(parent)
-                        await results_queue.put(result)
-                        parent_queue.task_done()
+                        grandparent = await remove_parent_directory(parent)
                         processed_count += 1
-                    except asyncio.TimeoutError:
-                        continue
+                        # Siblings return the same grandparent, so only count it once
+                        if grandparent is not None and grandparent not in new_empty_parents:
+                            new_empty_parents[grandparent] = _path_depth(grandparent)
+                            new_grandparents_collected += 1
                     except Exception as e:
                         exceptions_count += 1
-                        self.logger.debug(f"Exception in parent worker: {e}", exc_info=e)
-                        await self.update_stats(errors=1)
+                        self.logger.debug("Exception in parent worker: %s", e, exc_info=e)
+                        self.update_stats(errors=1)
+                    finally:
                         parent_queue.task_done()
 
             # Start workers (number limited by semaphore)
             num_workers = self.max_concurrency_deletion
             workers = [asyncio.create_task(parent_worker()) for _ in range(num_workers)]
 
-            # Producer: Feed parents to queue
-            async def parent_producer():
-                """Producer that feeds parent directories to queue."""
-                for parent in parents_to_process:
-                    if stop_event.is_set():
-                        break
-                    try:
-                        await parent_queue.put(parent)
-                    except Exception:
-                        break
-
-            producer_task = asyncio.create_task(parent_producer())
-
-            # Collect results as they complete
-            new_grandparents_collected = 0
-            while True:
-                if producer_task.done() and parent_queue.empty() and results_queue.empty():
-                    await asyncio.sleep(0.1)
-                    if parent_queue.empty() and results_queue.empty():
-                        break
-
-                try:
-                    result = await asyncio.wait_for(results_queue.get(), timeout=1.0)
-                    if isinstance(result, Exception):
-                        exceptions_count += 1
-                        self.logger.debug(f"Exception during parent deletion: {result}", exc_info=result)
-                        await self.update_stats(errors=1)
-                    elif result is not None:  # Grandparent became empty
-                        async with new_empty_parents_lock:
-                            new_empty_parents.add(result)
-                        new_grandparents_collected += 1
-                    results_queue.task_done()
-                except asyncio.TimeoutError:
-                    if producer_task.done() and parent_queue.empty():
-                        await asyncio.sleep(0.5)
-                        if results_queue.empty():
-                            break
-                    continue
-
-            # Wait for producer and workers
+            # Feed parents to the queue (blocks while it's full), then wait for the workers to drain it
             try:
-                await producer_task
-            except Exception as e:
-                self.logger.debug(f"Parent producer exception: {e}", exc_info=e)
-
-            stop_event.set()
-            await parent_queue.join()
-
-            for worker_task in workers:
-                worker_task.cancel()
-            await asyncio.gather(*workers, return_exceptions=True)
+                for parent in parents_to_process:
+                    await parent_queue.put(parent)
+                await parent_queue.join()
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                self._throttled_queues.pop(parent_queue, None)
 
             # Log progress for this iteration
             if exceptions_count > 0 or new_grandparents_collected > 0:
-                async with self.stats_lock:
-                    deleted_count = self.stats.get("empty_dirs_deleted", 0)
+                deleted_count = self.stats.empty_dirs_deleted
                 log_with_context(
                     self.logger,
                     "info" if exceptions_count == 0 else "warning",
@@ -1209,9 +1671,8 @@ class AsyncEFSPurger:
                 )
 
         # Log completion
-        async with self.stats_lock:
-            to_delete_count = self.stats.get("empty_dirs_to_delete", 0)
-            deleted_count = self.stats.get("empty_dirs_deleted", 0)
+        to_delete_count = self.stats.empty_dirs_to_delete
+        deleted_count = self.stats.empty_dirs_deleted
         log_with_context(
             self.logger,
             "info",
@@ -1223,209 +1684,282 @@ class AsyncEFSPurger:
             },
         )
 
-    async def _process_file_batch(self, file_tasks: list) -> None:
+    async def _process_file_paths(self, file_paths: list[str]) -> None:
         """
-        Process a batch of file tasks and free memory immediately.
+        Stat, age-check and (unless dry_run) remove a batch of files, SYSCALL_BATCH_SIZE at a time.
+
+        The batch's parent directories (normally just one, since scan_directory batches per
+        directory) are opened once up front, and every lstat and unlink is resolved relative to
+        them. Chunk tasks are created only as scanning permits become available, so at most
+        max_concurrency_scanning of them exist at once and each chunk's stat results are dropped
+        as soon as it is done (see _process_file_chunk). Counters go to a local _FileCounts merged
+        into stats every STATS_FLUSH_FILES files and at the end.
+        """
+        loop = asyncio.get_running_loop()
+        parents = {os.path.dirname(path) for path in file_paths}
+        dir_fds = await loop.run_in_executor(self.io_executor, _open_dir_fds, parents)
+        counts = _FileCounts()
+
+        # Chunk tasks holding a permit that haven't run their first step yet
+        unstarted = 0
+
+        async def run_chunk(chunk: list[str]) -> None:
+            nonlocal unstarted
+            unstarted -= 1
+            await self._process_file_chunk(chunk, dir_fds, counts)
+
+        # The whole batch is in flight from here until its removals finish
+        self.active_tasks += len(file_paths)
+        if self.active_tasks > self.max_active_tasks:
+            self.max_active_tasks = self.active_tasks
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i in range(0, len(file_paths), SYSCALL_BATCH_SIZE):
+                    # The permit passes to the chunk task, which releases it after its lstat hop
+                    await self.scanning_semaphore.acquire()
+                    unstarted += 1
+                    tg.create_task(run_chunk(file_paths[i : i + SYSCALL_BATCH_SIZE]))
+            if self._debug_enabled:
+                self.logger.debug("Processed batch of %s files", len(file_paths))
+        finally:
+            # When a chunk fails the TaskGroup cancels its siblings, and a task cancelled before its
+            # first step never runs its body - so the release in _process_file_chunk never happens
+            for _ in range(unstarted):
+                await self.scanning_semaphore.release()
+            self.active_tasks -= len(file_paths)
+            for dir_fd in dir_fds.values():
+                os.close(dir_fd)
+            self._flush_file_counts(counts)
+
+    async def _submit_file_batch(self, file_paths: list[str], wait: bool = False) -> None:
+        """
+        Hand a batch of file paths to the file-batch consumers.
+
+        Blocks while the queue is full, which is what throttles directory scanning when
+        file processing falls behind.
 
         Args:
-            file_tasks: List of file processing tasks
+            file_paths: Files to stat (and purge if old enough). Ownership passes to the consumer.
+            wait: If True, return only after the batch has been processed
         """
-        if not file_tasks:
+        queue = self._file_batch_queue
+        if queue is None:
+            # No pipeline running (shouldn't happen outside scan_directory) - process inline
+            await self._process_file_paths(file_paths)
             return
 
-        # Check memory before processing
-        await self.check_memory_pressure()  # Ignore return value for file batch processing
+        done = asyncio.get_running_loop().create_future() if wait else None
+        await queue.put((file_paths, done))
+        if done is not None:
+            await done
 
-        # Process batch - return_exceptions=True prevents one failure from canceling others
-        results = await asyncio.gather(*file_tasks, return_exceptions=True)
+    async def _file_batch_consumer(self, queue: _ResizableQueue) -> None:
+        """
+        Consume file batches from the queue until cancelled.
 
-        # Log any unexpected exceptions that weren't handled by process_file
-        # (process_file handles its own exceptions, but defensive check is good)
-        for result in results:
-            if isinstance(result, Exception):
+        Small batches (e.g. from directories holding a handful of files) are coalesced up to
+        task_batch_size so consumers keep the scanning semaphore busy.
+        """
+        while True:
+            items = [await queue.get()]
+            file_count = len(items[0][0])
+            while not queue.empty() and file_count + len(queue.peek()[0]) <= self.task_batch_size:
+                items.append(queue.get_nowait())
+                file_count += len(items[-1][0])
+
+            try:
+                await self._process_file_paths([path for paths, _ in items for path in paths])
+            except Exception as e:
                 log_with_context(
                     self.logger,
                     "error",
-                    "Unexpected exception in batch processing",
-                    {"error": str(result), "error_type": type(result).__name__},
+                    "Unexpected exception in file batch consumer",
+                    {"error": str(e), "error_type": type(e).__name__},
                 )
+            finally:
+                for _, done in items:
+                    if done is not None and not done.done():
+                        done.set_result(None)
+                    queue.task_done()
+
+    async def _directory_worker(self, queue: asyncio.Queue) -> None:
+        """Scan directories from the directory queue until cancelled."""
+        while True:
+            directory = await queue.get()
+            try:
+                # Cheap between RSS samples; shrinks the file-batch queue as memory climbs
+                await self._update_memory_pressure()
+                await self.scan_directory(directory)
+            except Exception as e:
+                # scan_directory should handle all exceptions, but log unexpected ones
+                log_with_context(
+                    self.logger,
+                    "error",
+                    "Unexpected exception in directory worker",
+                    {"directory": str(directory), "error": str(e), "error_type": type(e).__name__},
+                )
+            finally:
+                queue.task_done()
 
-        self.logger.debug(f"Processed batch of {len(file_tasks)} files")
-
-    async def _process_subdirs_with_constant_concurrency(self, subdirs: list[Path]) -> None:
+    async def _scan_tree(self, directory: str) -> None:
         """
-        Process subdirectories with constant concurrency using a hybrid approach.
-
-        This method maintains high concurrency utilization while preventing memory explosion:
-        - Uses semaphore to limit concurrent execution (maintains constant concurrency)
-        - Creates tasks on-demand as slots become available (prevents memory explosion)
-        - As tasks complete, new ones start immediately (high utilization)
+        Scan the tree rooted at directory with a fixed pool of workers.
 
-        Key benefits:
-        - Never creates more than max_concurrent_subdirs tasks at once
-        - Maintains constant concurrency (no idle slots waiting for slow directories)
-        - Prevents recursive memory explosion in deep directory trees
+        max_concurrent_subdirs directory workers pull from a directory queue, each scanning one
+        directory at a time and queueing its subdirectories, while the file-batch consumers run
+        alongside. Memory is bounded by the queues rather than by tree depth × width, and no task
+        is created per directory.
 
-        IMPORTANT: Before modifying this method or scan_directory's subdirectory processing,
-        test with 80×80×80 directory structure (518,481 dirs) to ensure no deadlock or
-        memory issues. See test_deep_directory_tree_memory_safety for details.
+        IMPORTANT: Before modifying the traversal, test with 80×80×80 directory structure
+        (518,481 dirs) to ensure no deadlock or memory issues.
+        See test_deep_directory_tree_memory_safety for details.
 
-        Args:
-            subdirs: List of subdirectory paths to process
+        Returns once the tree has been scanned and every queued file batch has been processed.
         """
-        if not subdirs:
-            return
-
-        # Use a queue to track remaining subdirectories
-        remaining_subdirs = list(subdirs)
-        active_tasks: list[asyncio.Task] = []
-
-        async def scan_with_semaphore(subdir: Path) -> None:
-            """Scan a subdirectory with semaphore control."""
-            async with self.subdir_semaphore:
-                await self.scan_directory(subdir)
-
-        # Process subdirectories maintaining constant concurrency
-        # We create tasks on-demand as slots become available, never exceeding max_concurrent_subdirs
-        iterations = 0
-        while remaining_subdirs or active_tasks:
-            iterations += 1
-
-            # Start new tasks up to the concurrency limit
-            # The semaphore ensures only max_concurrent_subdirs run concurrently,
-            # but we can have a few more tasks waiting (bounded by max_concurrent_subdirs)
-            while len(active_tasks) < self.max_concurrent_subdirs and remaining_subdirs:
-                subdir = remaining_subdirs.pop(0)
-                task = asyncio.create_task(scan_with_semaphore(subdir))
-                active_tasks.append(task)
-
-            # Wait for at least one task to complete before starting more
-            # This ensures we maintain constant concurrency without creating all tasks upfront
-            if active_tasks:
-                done, pending = await asyncio.wait(active_tasks, return_when=asyncio.FIRST_COMPLETED)
-
-                # Remove completed tasks and check for exceptions
-                for task in done:
-                    active_tasks.remove(task)
-                    # Check for exceptions (scan_directory handles its own, but log unexpected ones)
-                    try:
-                        await task
-                    except Exception as e:
-                        # scan_directory should handle all exceptions, but log unexpected ones
-                        log_with_context(
-                            self.logger,
-                            "error",
-                            "Unexpected exception in subdirectory scan",
-                            {"error": str(e), "error_type": type(e).__name__},
-                        )
-
-            # Debug: Log if we're stuck in a loop (shouldn't happen, but helps diagnose)
-            if iterations > 10000:
-                self.logger.warning(
-                    f"Warning: _process_subdirs_with_constant_concurrency has run {iterations} iterations. "
-                    f"Remaining subdirs: {len(remaining_subdirs)}, Active tasks: {len(active_tasks)}"
-                )
-                break
+        # LIFO keeps traversal depth-first, so pending directories stay around depth × fan-out
+        # instead of the width of the widest level. Deliberately unbounded: the workers are the
+        # queue's only consumers, so a bounded put() from a worker could deadlock the pool.
+        dir_queue: asyncio.Queue = asyncio.LifoQueue()
+        file_queue = _ResizableQueue(maxsize=self.file_batch_queue_size)
+        self._dir_queue = dir_queue
+        self._file_batch_queue = file_queue
+        self._throttle_queue(file_queue)
+        workers = [asyncio.create_task(self._file_batch_consumer(file_queue)) for _ in range(self.file_batch_consumers)]
+        workers += [asyncio.create_task(self._directory_worker(dir_queue)) for _ in range(self.max_concurrent_subdirs)]
+        try:
+            if self.shard_dirs is not None and not self.owns_root and directory == self._root_str:
+                for shard_dir in sorted(self.shard_dirs):
+                    dir_queue.put_nowait(shard_dir)
+            else:
+                dir_queue.put_nowait(directory)
+            await dir_queue.join()
+            await file_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._throttled_queues.pop(file_queue, None)
+            self._dir_queue = None
+            self._file_batch_queue = None
 
-    async def scan_directory(self, directory: Path) -> None:
+    async def scan_directory(self, directory: str | os.PathLike) -> None:
         """
-        Recursively scan a directory and process files using TRUE STREAMING.
+        Scan a directory and process files using TRUE STREAMING.
 
         This implementation uses a sliding window approach:
-        - Accumulates files into a buffer
-        - Processes and frees buffer when it reaches batch_size
+        - Accumulates file paths into a buffer
+        - Hands the buffer to the file-batch consumers when it reaches batch_size
         - Never holds all files in memory at once
-        - Much lower memory footprint
+        - Blocks on the bounded file-batch queue when processing falls behind
+
+        Subdirectories are queued for the directory workers rather than recursed into. The
+        outermost call starts the workers (see _scan_tree) and returns once the whole tree is done.
 
         Args:
-            directory: Directory path to scan
+            directory: Directory path to scan (callers may pass a Path; workers pass str)
         """
+        if self._dir_queue is None:
+            await self._scan_tree(os.fspath(directory))
+            return
+
         # Track this directory as actively being scanned (for stuck detection diagnostics)
         async with self.active_directories_lock:
             self.active_directories.add(directory)
 
         try:
-            await self.update_stats(dirs_scanned=1)
+            self.update_stats(dirs_scanned=1)
             # Record sample for rate tracking
             self.rate_tracker.record(self.current_phase, "dirs", 1)
 
+            # Files of a directory untouched since the last successful run were all seen then;
+            # its subdirectories are still scanned (their changes don't bump this mtime)
+            skip_files = False
+            if self._checkpoint_time is not None:
+                loop = asyncio.get_running_loop()
+                dir_stat = await loop.run_in_executor(self.io_executor, os.stat, directory)
+                skip_files = dir_stat.st_mtime < self._checkpoint_time
+                if skip_files:
+                    self.update_stats(unchanged_dirs_skipped=1)
+                    if self._debug_enabled:
+                        self.logger.debug("Skipping files of unchanged directory: %s", directory)
+
             # Scan directory entries
             entries = await async_scandir(directory, self.scandir_executor, self)
 
             # STREAMING: Use buffer instead of accumulating all tasks
-            file_task_buffer = []
+            file_buffer: list[str] = []
             subdirs = []
+            # Files must be gone before the empty-directory check can see this directory as empty
+            wait_for_files = self.remove_empty_dirs and not self.dry_run
+            task_batch_size = self.task_batch_size
+            # Skipped entries are counted locally and merged into stats once per directory
+            symlinks = special = entry_errors = 0
 
-            for entry in entries:
-                entry_path = Path(entry.path)
-
-                try:
-                    # Check if entry is a symlink (don't follow)
-                    is_symlink = await aiofiles.os.path.islink(entry_path)
-                    if is_symlink:
-                        await self.update_stats(symlinks_skipped=1)
-                        self.logger.debug(f"Skipping symlink: {entry_path}")
-                        continue
-
-                    # Handle files with streaming buffer
-                    if entry.is_file(follow_symlinks=False):
-                        file_task_buffer.append(self.process_file(entry_path))
-
-                        # STREAMING: Process and clear buffer when it reaches batch size
-                        if len(file_task_buffer) >= self.task_batch_size:
-                            try:
-                                await self._process_file_batch(file_task_buffer)
-                            finally:
-                                file_task_buffer.clear()  # Always clear, even on exception
-
-                    elif entry.is_dir(follow_symlinks=False):
-                        subdirs.append(entry_path)
-
-                    else:
-                        # Special file types: sockets, FIFOs, block/char devices, etc.
-                        # These are skipped and counted separately
-                        await self.update_stats(special_files_skipped=1)
-                        self.logger.debug(f"Skipping special file: {entry_path}")
-
-                except OSError as e:
-                    log_with_context(
-                        self.logger,
-                        "warning",
-                        "Error checking entry",
-                        {"path": str(entry_path), "error": str(e)},
-                    )
-                    await self.update_stats(errors=1)
+            try:
+                for entry in entries:
+                    try:
+                        # Check if entry is a symlink (don't follow). DirEntry answers from the
+                        # d_type scandir already returned - no lstat unless the FS reports DT_UNKNOWN
+                        if entry.is_symlink():
+                            symlinks += 1
+                            if self._debug_enabled:
+                                self.logger.debug("Skipping symlink: %s", entry.path)
+                            continue
+
+                        # Handle files with streaming buffer (entry.path is already the joined str)
+                        if entry.is_file(follow_symlinks=False):
+                            if skip_files:
+                                continue
+                            file_buffer.append(entry.path)
+
+                            # STREAMING: Hand off the buffer when it reaches batch size
+                            # (start a new list - the consumer now owns the old one)
+                            if len(file_buffer) >= task_batch_size:
+                                batch, file_buffer = file_buffer, []
+                                await self._submit_file_batch(batch, wait=wait_for_files)
+
+                        elif entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
 
-            # STREAMING: Process any remaining files in buffer
-            if file_task_buffer:
-                try:
-                    await self._process_file_batch(file_task_buffer)
-                finally:
-                    file_task_buffer.clear()  # Always clear, even on exception
-
-            # Process subdirectories using hybrid approach:
-            # - Semaphore maintains constant concurrency (prevents idle slots)
-            # - Tasks created in batches (prevents memory explosion)
-            # - As tasks complete, new ones start immediately (high utilization)
-            # Note: If we're already holding the semaphore (recursive call), process directly
-            # to avoid deadlock. Otherwise use the semaphore-controlled approach.
-            if subdirs:
-                await self.check_memory_pressure()  # Ignore return value for subdir processing
-                # Check if semaphore is available (not held by current task)
-                # If semaphore value equals limit, we're not holding it
-                if self.subdir_semaphore._value == self.max_concurrent_subdirs:
-                    # Not holding semaphore - use controlled concurrency
-                    await self._process_subdirs_with_constant_concurrency(subdirs)
-                else:
-                    # Already holding semaphore (recursive call) - process directly without semaphore
-                    # to avoid deadlock. Process sequentially to avoid creating too many tasks.
-                    for subdir in subdirs:
-                        await self.scan_directory(subdir)
+                        else:
+                            # Special file types: sockets, FIFOs, block/char devices, etc.
+                            # These are skipped and counted separately
+                            special += 1
+                            if self._debug_enabled:
+                                self.logger.debug("Skipping special file: %s", entry.path)
 
-            # Check if directory is empty (AFTER all subdirs have been fully processed recursively)
-            # This ensures nested empty directories are handled correctly
+                    except OSError as e:
+                        log_with_context(
+                            self.logger,
+                            "warning",
+                            "Error checking entry",
+                            {"path": entry.path, "error": str(e)},
+                        )
+                        entry_errors += 1
+            finally:
+                if symlinks or special or entry_errors:
+                    self.update_stats(symlinks_skipped=symlinks, special_files_skipped=special, errors=entry_errors)
+
+            # Release the listing (one DirEntry per entry) before possibly blocking on the queue
+            entries = entry = None
+
+            # STREAMING: Hand off any remaining files in buffer
+            if file_buffer:
+                batch, file_buffer = file_buffer, []
+                await self._submit_file_batch(batch, wait=wait_for_files)
+
+            # Queue subdirectories for the directory workers (no recursion - the call stack
+            # and this frame's buffers are released as soon as this directory is done)
+            for subdir in subdirs:
+                if self.shard_dirs is None or directory != self._root_str or subdir in self.shard_dirs:
+                    self._dir_queue.put_nowait(subdir)
+
+            # Check if directory is empty once its own files have been processed.
+            # A directory with subdirectories is never empty here: scanning doesn't remove
+            # directories, so nested empty directories are picked up as leaves and their
+            # parents by the cascade in _remove_empty_directories().
             # Only check if remove_empty_dirs is enabled
-            if self.remove_empty_dirs:
+            if self.remove_empty_dirs and not subdirs:
                 await self._check_empty_directory(directory)
 
         except PermissionError as e:
@@ -1435,7 +1969,7 @@ class AsyncEFSPurger:
                 "Permission denied for directory",
                 {"directory": str(directory), "error": str(e)},
             )
-            await self.update_stats(errors=1)
+            self.update_stats(errors=1)
         except Exception as e:
             log_with_context(
                 self.logger,
@@ -1443,7 +1977,7 @@ class AsyncEFSPurger:
                 "Error scanning directory",
                 {"directory": str(directory), "error": str(e), "error_type": type(e).__name__},
             )
-            await self.update_stats(errors=1)
+            self.update_stats(errors=1)
         finally:
             # Remove from active directories when done (success or failure)
             async with self.active_directories_lock:
@@ -1461,151 +1995,145 @@ class AsyncEFSPurger:
             await asyncio.sleep(self.progress_interval)
 
             # Log current progress
-            async with self.stats_lock:
-                current_time = time.time()
-                elapsed = current_time - self.stats.get("start_time", current_time)
-
-                current_files = self.stats["files_scanned"]
-                current_dirs = self.stats["dirs_scanned"]
-
-                # Calculate overall rates using scanning duration only (excludes empty dir removal time)
-                # If scanning is complete, use scanning duration; otherwise use elapsed time
-                if self.scanning_end_time is not None:
-                    scanning_duration = self.scanning_end_time - self.stats.get("start_time", current_time)
-                    files_per_second_overall = (
-                        self.stats["files_scanned"] / scanning_duration if scanning_duration > 0 else 0
-                    )
-                    dirs_per_second_overall = current_dirs / scanning_duration if scanning_duration > 0 else 0.0
-                else:
-                    # Still scanning, use elapsed time
-                    files_per_second_overall = self.stats["files_scanned"] / elapsed if elapsed > 0 else 0
-                    dirs_per_second_overall = current_dirs / elapsed if elapsed > 0 else 0.0
-
-                memory_mb = get_memory_usage_mb()
-                memory_percent = (memory_mb / self.memory_limit_mb * 100) if self.memory_limit_mb > 0 else 0
-
-                # Time-windowed rates (instant 10s, short-term 60s)
-                files_per_second_instant = self.rate_tracker.get_rate("scanning", "files", 10.0)
-                dirs_per_second_instant = self.rate_tracker.get_rate("scanning", "dirs", 10.0)
-                files_per_second_short = self.rate_tracker.get_rate("scanning", "files", 60.0)
-                dirs_per_second_short = self.rate_tracker.get_rate("scanning", "dirs", 60.0)
-
-                # Per-phase rates
-                scanning_files_rate = self.rate_tracker.get_phase_rate("scanning", "files")
-                scanning_dirs_rate = self.rate_tracker.get_phase_rate("scanning", "dirs")
-                deletion_files_rate = self.rate_tracker.get_phase_rate("deletion", "files")
-                empty_dirs_rate = self.rate_tracker.get_phase_rate("removing_empty_dirs", "dirs")
-
-                # Update peak rates
-                self.rate_tracker.update_peak_rate("files_per_second", files_per_second_overall)
-                self.rate_tracker.update_peak_rate("dirs_per_second", dirs_per_second_overall)
-                if deletion_files_rate > 0:
-                    self.rate_tracker.update_peak_rate("files_deleted_per_second", deletion_files_rate)
-                if empty_dirs_rate > 0:
-                    self.rate_tracker.update_peak_rate("empty_dirs_per_second", empty_dirs_rate)
-
-                # Get concurrency utilization metrics
+            current_time = time.time()
+
+            # Snapshot every counter once; all derived values below come from these locals
+            stats = self.stats
+            start_time = stats.start_time
+            current_files = stats.files_scanned
+            current_dirs = stats.dirs_scanned
+            files_purged = stats.files_purged
+            files_to_purge = stats.files_to_purge
+            errors = stats.errors
+            backpressure_events = stats.memory_backpressure_events
+            empty_dirs_deleted = stats.empty_dirs_deleted
+            empty_dirs_to_delete = stats.empty_dirs_to_delete
+            phase = self.current_phase
+            elapsed = current_time - start_time
+
+            # Calculate overall rates using scanning duration only (excludes empty dir removal time)
+            # If scanning is complete, use scanning duration; otherwise use elapsed time
+            if self.scanning_end_time is not None:
+                rate_duration = self.scanning_end_time - start_time
+            else:
+                rate_duration = elapsed
+            if rate_duration > 0:
+                files_per_second_overall = current_files / rate_duration
+                dirs_per_second_overall = current_dirs / rate_duration
+            else:
+                files_per_second_overall = 0.0
+                dirs_per_second_overall = 0.0
+
+            # Reuse the sampler's reading rather than reading RSS again
+            memory_mb = self._memory_sample_mb if self._memory_sampler_task is not None else get_memory_usage_mb()
+            memory_limit_mb = self.memory_limit_mb
+            memory_percent = (memory_mb / memory_limit_mb * 100) if memory_limit_mb > 0 else 0
+
+            # Per-phase rates needed for peak tracking
+            rate_tracker = self.rate_tracker
+            deletion_files_rate = rate_tracker.get_phase_rate("deletion", "files")
+            empty_dirs_rate = rate_tracker.get_phase_rate("removing_empty_dirs", "dirs")
+
+            # Update peak rates
+            rate_tracker.update_peak_rate("files_per_second", files_per_second_overall)
+            rate_tracker.update_peak_rate("dirs_per_second", dirs_per_second_overall)
+            if deletion_files_rate > 0:
+                rate_tracker.update_peak_rate("files_deleted_per_second", deletion_files_rate)
+            if empty_dirs_rate > 0:
+                rate_tracker.update_peak_rate("empty_dirs_per_second", empty_dirs_rate)
+
+            # Check if DEBUG level logging is enabled
+            is_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+            # Build progress update with phase-specific metrics
+            progress_data = {
+                # Always shown
+                "elapsed_seconds": round(elapsed, 1),
+                "phase": phase,
+                "errors": errors,
+                "memory_backpressure_events": backpressure_events,
+            }
+
+            # Phase-specific metrics
+            if phase == "removing_empty_dirs":
+                # During empty dir removal: show dir removal metrics
+                progress_data["dirs_purged"] = empty_dirs_deleted
+                progress_data["dirs_to_purge"] = empty_dirs_to_delete
+            else:
+                # During scanning: show file/dir scanning metrics
+                progress_data["files_scanned"] = current_files
+                progress_data["files_purged"] = files_purged
+                progress_data["dirs_scanned"] = current_dirs
+                # Add files/dirs to purge if non-zero
+                if files_to_purge > 0:
+                    progress_data["files_to_purge"] = files_to_purge
+            # Overall rates (from the scanning phase once it has finished)
+            progress_data["files_per_second"] = round(files_per_second_overall, 1)
+            progress_data["dirs_per_second"] = round(dirs_per_second_overall, 1)
+
+            # Memory usage (always shown)
+            progress_data["memory_mb"] = round(memory_mb, 1)
+            progress_data["memory_usage_percent"] = round(memory_percent, 1)
+            progress_data["memory_pressure"] = self.memory_pressure_state.name
+
+            # DEBUG-only detailed metrics (windowed rates and concurrency are only computed here)
+            if is_debug:
                 async with self.active_tasks_lock:
                     current_active_tasks = self.active_tasks
                     peak_active_tasks = self.max_active_tasks
 
-                # Calculate semaphore availability (approximate)
-                # Note: Semaphore doesn't expose available count, so we estimate
+                # Semaphore doesn't expose available count, so we estimate
                 # For backward compatibility, use max of both limits
                 max_concurrency_total = max(self.max_concurrency_scanning, self.max_concurrency_deletion)
-                available_slots = max(0, max_concurrency_total - current_active_tasks)
-                concurrency_utilization_percent = (
+                utilization_percent = (
                     (current_active_tasks / max_concurrency_total * 100) if max_concurrency_total > 0 else 0.0
                 )
+                peak_rates = rate_tracker.peak_rates
 
-                # Check if DEBUG level logging is enabled
-                is_debug = self.logger.isEnabledFor(logging.DEBUG)
-
-                # Build progress update with phase-specific metrics
-                progress_data = {
-                    # Always shown
-                    "elapsed_seconds": round(elapsed, 1),
-                    "phase": self.current_phase,
-                    "errors": self.stats["errors"],
-                    "memory_backpressure_events": self.stats.get("memory_backpressure_events", 0),
-                }
-
-                # Phase-specific metrics
-                if self.current_phase == "removing_empty_dirs":
-                    # During empty dir removal: show dir removal metrics
-                    progress_data["dirs_purged"] = self.stats.get("empty_dirs_deleted", 0)
-                    progress_data["dirs_to_purge"] = self.stats.get("empty_dirs_to_delete", 0)
-                    # Show overall rates (from scanning phase)
-                    progress_data["files_per_second"] = round(files_per_second_overall, 1)
-                    progress_data["dirs_per_second"] = round(dirs_per_second_overall, 1)
-                else:
-                    # During scanning: show file/dir scanning metrics
-                    progress_data["files_scanned"] = current_files
-                    progress_data["files_purged"] = self.stats["files_purged"]
-                    progress_data["dirs_scanned"] = current_dirs
-                    # Add files/dirs to purge if non-zero
-                    if self.stats["files_to_purge"] > 0:
-                        progress_data["files_to_purge"] = self.stats["files_to_purge"]
-                    # Show overall rates
-                    progress_data["files_per_second"] = round(files_per_second_overall, 1)
-                    progress_data["dirs_per_second"] = round(dirs_per_second_overall, 1)
-
-                # Memory usage (always shown)
-                progress_data["memory_mb"] = round(memory_mb, 1)
-                progress_data["memory_usage_percent"] = round(memory_percent, 1)
-
-                # DEBUG-only detailed metrics
-                if is_debug:
-                    # Enhanced rate metrics - overall
-                    progress_data["files_per_second_overall"] = round(files_per_second_overall, 1)
-                    progress_data["dirs_per_second_overall"] = round(dirs_per_second_overall, 1)
-                    # Time-windowed rates
-                    progress_data["files_per_second_instant"] = round(files_per_second_instant, 1)
-                    progress_data["dirs_per_second_instant"] = round(dirs_per_second_instant, 1)
-                    progress_data["files_per_second_short"] = round(files_per_second_short, 1)
-                    progress_data["dirs_per_second_short"] = round(dirs_per_second_short, 1)
-                    # Per-phase rates
-                    progress_data["scanning_files_per_second"] = round(scanning_files_rate, 1)
-                    progress_data["scanning_dirs_per_second"] = round(scanning_dirs_rate, 1)
-                    progress_data["deletion_files_per_second"] = round(deletion_files_rate, 1)
-                    progress_data["empty_dirs_per_second"] = round(empty_dirs_rate, 1)
-                    # Peak rates
-                    progress_data["peak_files_per_second"] = round(
-                        self.rate_tracker.peak_rates["files_per_second"]["value"], 1
-                    )
-                    progress_data["peak_dirs_per_second"] = round(
-                        self.rate_tracker.peak_rates["dirs_per_second"]["value"], 1
-                    )
-                    progress_data["peak_files_deleted_per_second"] = round(
-                        self.rate_tracker.peak_rates["files_deleted_per_second"]["value"], 1
-                    )
-                    progress_data["peak_empty_dirs_per_second"] = round(
-                        self.rate_tracker.peak_rates["empty_dirs_per_second"]["value"], 1
-                    )
-                    # Concurrency utilization metrics
-                    progress_data["active_tasks"] = current_active_tasks
-                    progress_data["max_active_tasks"] = peak_active_tasks
-                    progress_data["available_concurrency_slots"] = available_slots
-                    progress_data["concurrency_utilization_percent"] = round(concurrency_utilization_percent, 1)
-                    # Detailed memory metrics
-                    progress_data["memory_mb_per_1k_files"] = (
-                        round(memory_mb / (self.stats["files_scanned"] / 1000), 2)
-                        if self.stats["files_scanned"] > 0
-                        else 0.0
-                    )
-
-                log_with_context(
-                    self.logger,
-                    "info",
-                    "Progress update",
-                    progress_data,
+                progress_data.update(
+                    {
+                        # Enhanced rate metrics - overall
+                        "files_per_second_overall": round(files_per_second_overall, 1),
+                        "dirs_per_second_overall": round(dirs_per_second_overall, 1),
+                        # Time-windowed rates (instant 10s, short-term 60s)
+                        "files_per_second_instant": round(rate_tracker.get_rate("scanning", "files", 10.0), 1),
+                        "dirs_per_second_instant": round(rate_tracker.get_rate("scanning", "dirs", 10.0), 1),
+                        "files_per_second_short": round(rate_tracker.get_rate("scanning", "files", 60.0), 1),
+                        "dirs_per_second_short": round(rate_tracker.get_rate("scanning", "dirs", 60.0), 1),
+                        # Per-phase rates
+                        "scanning_files_per_second": round(rate_tracker.get_phase_rate("scanning", "files"), 1),
+                        "scanning_dirs_per_second": round(rate_tracker.get_phase_rate("scanning", "dirs"), 1),
+                        "deletion_files_per_second": round(deletion_files_rate, 1),
+                        "empty_dirs_per_second": round(empty_dirs_rate, 1),
+                        # Peak rates
+                        "peak_files_per_second": round(peak_rates["files_per_second"]["value"], 1),
+                        "peak_dirs_per_second": round(peak_rates["dirs_per_second"]["value"], 1),
+                        "peak_files_deleted_per_second": round(peak_rates["files_deleted_per_second"]["value"], 1),
+                        "peak_empty_dirs_per_second": round(peak_rates["empty_dirs_per_second"]["value"], 1),
+                        # Concurrency utilization metrics
+                        "active_tasks": current_active_tasks,
+                        "max_active_tasks": peak_active_tasks,
+                        "available_concurrency_slots": max(0, max_concurrency_total - current_active_tasks),
+                        "concurrency_utilization_percent": round(utilization_percent, 1),
+                        # Detailed memory metrics
+                        "memory_mb_per_1k_files": (
+                            round(memory_mb / (current_files / 1000), 2) if current_files > 0 else 0.0
+                        ),
+                    }
                 )
 
-                # Track when we last logged progress (used by final progress check)
-                self.last_progress_log = current_time
+            log_with_context(
+                self.logger,
+                "info",
+                "Progress update",
+                progress_data,
+            )
+
+            # Track when we last logged progress (used by final progress check)
+            self.last_progress_log = current_time
 
             # Get empty dir deletion progress
-            current_empty_dirs_deleted = self.stats.get("empty_dirs_deleted", 0)
+            current_empty_dirs_deleted = empty_dirs_deleted
 
             # Stuck detection: check if progress has stalled
             # During scanning phase: check files_scanned and dirs_scanned
@@ -1624,7 +2152,7 @@ class AsyncEFSPurger:
                             {
                                 "phase": "removing_empty_dirs",
                                 "empty_dirs_deleted": current_empty_dirs_deleted,
-                                "empty_dirs_to_delete": self.stats.get("empty_dirs_to_delete", 0),
+                                "empty_dirs_to_delete": self.stats.empty_dirs_to_delete,
                                 "stuck_intervals": self.stuck_detection_count,
                                 "hint": "Large number of empty directories can take time. "
                                 "If this persists, the filesystem may be slow or unresponsive.",
@@ -1700,6 +2228,7 @@ class AsyncEFSPurger:
             f"Starting EFS purge - {mode} MODE",
             {
                 "version": __version__,
+                "event_loop": type(asyncio.get_running_loop()).__module__.split(".")[0],
                 "root_path": str(self.root_path),
                 "max_age_days": self.max_age_days,
                 "cutoff_time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.cutoff_time)),
@@ -1713,24 +2242,43 @@ class AsyncEFSPurger:
                 "max_concurrent_subdirs": self.max_concurrent_subdirs,
                 "remove_empty_dirs": self.remove_empty_dirs,
                 "max_empty_dirs_to_delete": self.max_empty_dirs_to_delete,
+                "skip_unchanged_dirs": self.skip_unchanged_dirs,
+                "adaptive_concurrency": self.adaptive_concurrency,
                 "scandir_executor_threads": self.scandir_executor._max_workers,
+                "io_executor_threads": self.io_executor._max_workers,
             },
         )
 
-        # Verify root path exists
-        if not await aiofiles.os.path.exists(self.root_path):
+        # Verify root path exists (a single syscall before any work starts - no need for the executor)
+        if not os.path.exists(self.root_path):
             error_msg = f"Root path does not exist: {self.root_path}"
             log_with_context(self.logger, "error", error_msg, {"root_path": str(self.root_path)})
             raise FileNotFoundError(error_msg)
 
+        if self.skip_unchanged_dirs:
+            self._checkpoint_time = load_checkpoint(self.checkpoint_path)
+            log_with_context(
+                self.logger,
+                "info",
+                "Skipping files of directories unchanged since last successful scan"
+                if self._checkpoint_time is not None
+                else "No checkpoint found - scanning all directories",
+                {"checkpoint_path": self.checkpoint_path, "checkpoint_time": self._checkpoint_time},
+            )
+
         # Start background progress reporter
         progress_task = asyncio.create_task(self._background_progress_reporter())
+        # Sample memory once up front, then in the background only (see _update_memory_pressure)
+        if self.memory_limit_mb > 0:
+            await self._sample_memory_pressure()
+            self._memory_sampler_task = asyncio.create_task(self._memory_sampler())
+        latency_task = asyncio.create_task(self._latency_controller()) if self.adaptive_concurrency else None
 
         try:
-            # Start the recursive scan
+            # Scan the tree (directory workers + file-batch consumers, see _scan_tree)
             self.current_phase = "scanning"
             self.rate_tracker.set_phase_start("scanning")
-            await self.scan_directory(self.root_path)
+            await self.scan_directory(self._root_str)
 
             # Mark scanning phase as complete (for accurate overall rate calculation)
             self.scanning_end_time = time.time()
@@ -1738,32 +2286,42 @@ class AsyncEFSPurger:
             # After all scanning is complete, remove empty directories in post-order
             if self.remove_empty_dirs:
                 await self._remove_empty_directories()
+
+            # A dry run deleted nothing, so it must not let the next run skip anything
+            if self.skip_unchanged_dirs and self.write_checkpoint and not self.dry_run:
+                _save_checkpoint_or_warn(self.logger, self.checkpoint_path, start_time)
         finally:
-            # Cancel background reporter
-            progress_task.cancel()
-            try:
-                await progress_task
-            except asyncio.CancelledError:
-                pass  # Expected
+            # Cancel background reporter, memory sampler and latency controller
+            sampler_task, self._memory_sampler_task = self._memory_sampler_task, None
+            for task in (progress_task, sampler_task, latency_task):
+                if task is None:
+                    continue
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass  # Expected
 
             # Log final diagnostics if DEBUG is enabled
             if self.logger.isEnabledFor(logging.DEBUG) and self.scandir_call_count > 0:
                 await _log_scandir_diagnostics(self, self.scandir_executor)
 
-            # Shutdown custom executor for directory scanning
+            # Shutdown custom executors for directory scanning and file I/O
             if hasattr(self, "scandir_executor"):
                 self.scandir_executor.shutdown(wait=False)
+            if hasattr(self, "io_executor"):
+                self.io_executor.shutdown(wait=False)
 
         # Log one final progress update if we haven't logged recently
-        elapsed = time.time() - self.stats.get("start_time", time.time())
+        elapsed = time.time() - self.stats.start_time
         if elapsed > self.progress_interval and (time.time() - self.last_progress_log) > 10:
             # Force a final progress update
             # Use scanning duration for rate calculation (excludes empty dir removal time)
             if self.scanning_end_time is not None:
-                scanning_duration = self.scanning_end_time - self.stats.get("start_time", time.time())
-                rate = self.stats["files_scanned"] / scanning_duration if scanning_duration > 0 else 0
+                scanning_duration = self.scanning_end_time - self.stats.start_time
+                rate = self.stats.files_scanned / scanning_duration if scanning_duration > 0 else 0
             else:
-                rate = self.stats["files_scanned"] / elapsed if elapsed > 0 else 0
+                rate = self.stats.files_scanned / elapsed if elapsed > 0 else 0
 
             memory_mb = get_memory_usage_mb()
             is_debug = self.logger.isEnabledFor(10)  # 10 = DEBUG level
@@ -1771,22 +2329,22 @@ class AsyncEFSPurger:
             final_progress_data = {
                 # Core metrics in requested order
                 "elapsed_seconds": round(elapsed, 1),
-                "files_scanned": self.stats["files_scanned"],
-                "files_purged": self.stats["files_purged"],
-                "dirs_scanned": self.stats["dirs_scanned"],
-                "errors": self.stats["errors"],
-                "memory_backpressure_events": self.stats.get("memory_backpressure_events", 0),
+                "files_scanned": self.stats.files_scanned,
+                "files_purged": self.stats.files_purged,
+                "dirs_scanned": self.stats.dirs_scanned,
+                "errors": self.stats.errors,
+                "memory_backpressure_events": self.stats.memory_backpressure_events,
             }
 
             # Add dirs purged if any were deleted
-            if self.stats.get("empty_dirs_deleted", 0) > 0:
-                final_progress_data["dirs_purged"] = self.stats.get("empty_dirs_deleted", 0)
+            if self.stats.empty_dirs_deleted > 0:
+                final_progress_data["dirs_purged"] = self.stats.empty_dirs_deleted
 
             # Add files/dirs to purge if non-zero
-            if self.stats["files_to_purge"] > 0:
-                final_progress_data["files_to_purge"] = self.stats["files_to_purge"]
-            if self.stats.get("empty_dirs_to_delete", 0) > 0:
-                final_progress_data["dirs_to_purge"] = self.stats.get("empty_dirs_to_delete", 0)
+            if self.stats.files_to_purge > 0:
+                final_progress_data["files_to_purge"] = self.stats.files_to_purge
+            if self.stats.empty_dirs_to_delete > 0:
+                final_progress_data["dirs_to_purge"] = self.stats.empty_dirs_to_delete
 
             # Rates and memory
             final_progress_data["files_per_second"] = round(rate, 1)
@@ -1804,10 +2362,10 @@ class AsyncEFSPurger:
         # Use scanning duration for files_per_second (excludes empty dir removal time)
         if self.scanning_end_time is not None:
             scanning_duration = self.scanning_end_time - start_time
-            files_per_sec = self.stats["files_scanned"] / scanning_duration if scanning_duration > 0 else 0
+            files_per_sec = self.stats.files_scanned / scanning_duration if scanning_duration > 0 else 0
         else:
-            files_per_sec = self.stats["files_scanned"] / duration if duration > 0 else 0
-        mb_freed = self.stats["bytes_freed"] / (1024 * 1024)
+            files_per_sec = self.stats.files_scanned / duration if duration > 0 else 0
+        mb_freed = self.stats.bytes_freed / (1024 * 1024)
         memory_mb = get_memory_usage_mb()
         is_debug = self.logger.isEnabledFor(10)  # 10 = DEBUG level
 
@@ -1815,36 +2373,38 @@ class AsyncEFSPurger:
         final_stats = {
             # Core metrics in requested order
             "duration_seconds": round(duration, 2),
-            "files_scanned": self.stats["files_scanned"],
-            "files_purged": self.stats["files_purged"],
-            "dirs_scanned": self.stats["dirs_scanned"],
-            "errors": self.stats["errors"],
-            "memory_backpressure_events": self.stats.get("memory_backpressure_events", 0),
+            "files_scanned": self.stats.files_scanned,
+            "files_purged": self.stats.files_purged,
+            "dirs_scanned": self.stats.dirs_scanned,
+            "errors": self.stats.errors,
+            "memory_backpressure_events": self.stats.memory_backpressure_events,
         }
 
         # Add dirs purged if any were deleted
-        if self.stats.get("empty_dirs_deleted", 0) > 0:
-            final_stats["dirs_purged"] = self.stats.get("empty_dirs_deleted", 0)
+        if self.stats.empty_dirs_deleted > 0:
+            final_stats["dirs_purged"] = self.stats.empty_dirs_deleted
 
         # Add files/dirs to purge if non-zero
-        if self.stats["files_to_purge"] > 0:
-            final_stats["files_to_purge"] = self.stats["files_to_purge"]
-        if self.stats.get("empty_dirs_to_delete", 0) > 0:
-            final_stats["dirs_to_purge"] = self.stats.get("empty_dirs_to_delete", 0)
+        if self.stats.files_to_purge > 0:
+            final_stats["files_to_purge"] = self.stats.files_to_purge
+        if self.stats.empty_dirs_to_delete > 0:
+            final_stats["dirs_to_purge"] = self.stats.empty_dirs_to_delete
 
         # Rates and memory
         final_stats["files_per_second"] = round(files_per_sec, 2)
         final_stats["mb_freed"] = round(mb_freed, 2)
         final_stats["peak_memory_mb"] = round(memory_mb, 1)
+        if self.skip_unchanged_dirs:
+            final_stats["unchanged_dirs_skipped"] = self.stats.unchanged_dirs_skipped
 
         # DEBUG-only: include all stats for detailed analysis
         if is_debug:
             final_stats.update(
                 {
-                    "symlinks_skipped": self.stats.get("symlinks_skipped", 0),
-                    "special_files_skipped": self.stats.get("special_files_skipped", 0),
-                    "bytes_freed": self.stats.get("bytes_freed", 0),
-                    "start_time": self.stats.get("start_time"),
+                    "symlinks_skipped": self.stats.symlinks_skipped,
+                    "special_files_skipped": self.stats.special_files_skipped,
+                    "bytes_freed": self.stats.bytes_freed,
+                    "start_time": self.stats.start_time,
                 }
             )
 
@@ -1871,6 +2431,9 @@ async def async_main(
     remove_empty_dirs: bool = False,
     max_empty_dirs_to_delete: int = 500,
     max_concurrent_subdirs: int = 100,
+    skip_unchanged_dirs: bool = False,
+    io_threads: int | None = None,
+    adaptive_concurrency: bool = False,
 ) -> dict:
     """
     Async entry point for the purger.
@@ -1888,6 +2451,9 @@ async def async_main(
         remove_empty_dirs: If True, remove empty directories after scanning
         max_empty_dirs_to_delete: Maximum empty directories to delete per run (0 = unlimited, default: 500)
         max_concurrent_subdirs: Maximum subdirectories to scan concurrently (lower = less memory, default: 100)
+        skip_unchanged_dirs: If True, skip files of directories unchanged since the last successful run
+        io_threads: Threads for file/directory syscalls (default: scales with max concurrency)
+        adaptive_concurrency: If True, narrow stat/delete concurrency while file I/O latency climbs
 
     Returns:
         Operation statistics
@@ -1905,6 +2471,173 @@ async def async_main(
         remove_empty_dirs=remove_empty_dirs,
         max_empty_dirs_to_delete=max_empty_dirs_to_delete,
         max_concurrent_subdirs=max_concurrent_subdirs,
+        skip_unchanged_dirs=skip_unchanged_dirs,
+        io_threads=io_threads,
+        adaptive_concurrency=adaptive_concurrency,
     )
 
     return await purger.purge()
+
+
+def _plan_shards(root: Path, processes: int) -> list[list[Path]]:
+    """
+    Split root's top-level subdirectories into balanced shards.
+
+    Each subdirectory is weighted by its own entry count (a cheap estimate of its size) and
+    assigned, largest first, to the least-loaded shard.
+
+    Args:
+        root: Root directory
+        processes: Maximum number of shards
+
+    Returns:
+        Non-empty list of shards (the first shard may be empty if root has no subdirectories)
+    """
+    weighted: list[tuple[int, Path]] = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    with os.scandir(entry.path) as sub_entries:
+                        weight = sum(1 for _ in sub_entries) + 1
+                except OSError:
+                    weight = 1
+                weighted.append((weight, Path(entry.path)))
+
+    shard_count = max(1, min(processes, len(weighted)))
+    shards: list[list[Path]] = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for weight, directory in sorted(weighted, key=lambda item: item[0], reverse=True):
+        index = loads.index(min(loads))
+        shards[index].append(directory)
+        loads[index] += weight
+    return shards
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop (``pip install efspurge[uvloop]``) is a faster drop-in event loop for workloads
+    dominated by many small tasks, semaphores and executor hand-offs. Falls back to the
+    standard asyncio loop if it isn't available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
+def _split_limit(total: int, parts: int) -> list[int]:
+    """Split total into parts integer shares that differ by at most one and sum to total."""
+    share, remainder = divmod(total, parts)
+    return [share + 1 if index < remainder else share for index in range(parts)]
+
+
+def _run_shard(shard_dirs: list[str], owns_root: bool, purger_kwargs: dict) -> dict:
+    """Run one shard of a sharded purge (executed in a worker process)."""
+
+    async def run() -> dict:
+        purger = AsyncEFSPurger(**purger_kwargs)
+        purger.shard_dirs = set(shard_dirs)
+        purger.owns_root = owns_root
+        purger.write_checkpoint = False
+        return await purger.purge()
+
+    return run_async(run())
+
+
+def run_sharded(path: str, processes: int, **purger_kwargs) -> dict:
+    """
+    Purge path with its top-level subdirectories split across worker processes.
+
+    Scanning is latency-bound on EFS, but the Python-side book-keeping runs on a single core.
+    When the root holds many independent top-level subdirectories (e.g. /data/tenant-*/...),
+    running one AsyncEFSPurger per shard in separate processes scales that overhead across cores.
+
+    memory_limit_mb and max_empty_dirs_to_delete are divided between the shards so the
+    totals match a single-process run.
+
+    Args:
+        path: Root path to purge
+        processes: Number of worker processes (capped at the number of top-level subdirectories)
+        **purger_kwargs: Remaining AsyncEFSPurger arguments
+
+    Returns:
+        Operation statistics merged across shards
+    """
+    root = Path(path)
+    if not root.is_absolute():
+        root = root.resolve()
+    if not root.exists():
+        raise FileNotFoundError(f"Path does not exist: {root}")
+
+    start_time = time.time()
+    shards = _plan_shards(root, processes)
+    shard_count = len(shards)
+
+    # Resolve dry_run once, with AsyncEFSPurger's default, so the shards and the checkpoint agree
+    dry_run = purger_kwargs.get("dry_run", True)
+    shard_kwargs = dict(purger_kwargs, root_path=str(root), dry_run=dry_run)
+    memory_limit_mb = shard_kwargs.get("memory_limit_mb", 800)
+    if memory_limit_mb > 0:
+        shard_kwargs["memory_limit_mb"] = max(1, memory_limit_mb // shard_count)
+    max_empty_dirs_to_delete = shard_kwargs.get("max_empty_dirs_to_delete", 500)
+    per_shard_kwargs = [shard_kwargs] * shard_count
+    if max_empty_dirs_to_delete > 0:
+        # The shares add up to exactly the total; a shard whose share is 0 can't remove any empty
+        # directories (a limit of 0 would mean unlimited), so removal is switched off for it
+        per_shard_kwargs = [
+            dict(shard_kwargs, max_empty_dirs_to_delete=limit)
+            if limit > 0
+            else dict(shard_kwargs, remove_empty_dirs=False, max_empty_dirs_to_delete=0)
+            for limit in _split_limit(max_empty_dirs_to_delete, shard_count)
+        ]
+
+    logger = setup_logging("efspurge", purger_kwargs.get("log_level", "INFO"))
+    log_with_context(
+        logger,
+        "info",
+        "Starting sharded EFS purge",
+        {
+            "root_path": str(root),
+            "processes": shard_count,
+            "top_level_dirs_per_shard": [len(shard) for shard in shards],
+        },
+    )
+
+    with ProcessPoolExecutor(max_workers=shard_count, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [
+            executor.submit(_run_shard, [str(d) for d in shard], index == 0, per_shard_kwargs[index])
+            for index, shard in enumerate(shards)
+        ]
+        shard_stats = [future.result() for future in futures]
+
+    if shard_kwargs.get("skip_unchanged_dirs") and not dry_run:
+        _save_checkpoint_or_warn(logger, checkpoint_path(root), start_time)
+
+    # Merge: counters add up, duration is wall-clock, rates are recomputed. peak_memory_mb keeps
+    # its single-process meaning (the largest process); the processes' combined peak is reported
+    # separately as total_peak_memory_mb.
+    merged: dict = {"duration_seconds": round(time.time() - start_time, 2)}
+    for stats in shard_stats:
+        for key, value in stats.items():
+            if key in ("duration_seconds", "files_per_second", "start_time"):
+                continue
+            if key == "peak_memory_mb":
+                merged[key] = max(merged.get(key, 0), value)
+                merged["total_peak_memory_mb"] = merged.get("total_peak_memory_mb", 0) + value
+                continue
+            merged[key] = merged.get(key, 0) + value
+    duration = merged["duration_seconds"]
+    merged["files_per_second"] = round(merged.get("files_scanned", 0) / duration if duration > 0 else 0, 2)
+    for key in ("mb_freed", "peak_memory_mb", "total_peak_memory_mb"):
+        if key in merged:
+            merged[key] = round(merged[key], 2)
+    merged["processes"] = shard_count
+
+    log_with_context(logger, "info", "Sharded purge operation completed", merged)
+    return merged
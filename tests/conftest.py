@@ -3,8 +3,23 @@
 import sys
 from pathlib import Path
 
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add src directory to Python path to ensure tests use local source code
 # instead of installed package
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop when it is installed, like the CLI does (see run_async)."""
+        return uvloop.EventLoopPolicy()
@@ -57,3 +57,110 @@ async def test_purger_initialization():
     assert purger.root_path.name == "test"
     assert purger.max_age_days == 30
     assert purger.dry_run is True
+
+
+@pytest.mark.asyncio
+async def test_debug_enabled_follows_log_level():
+    """Test that the cached debug flag matches the configured log level."""
+    from efspurge.purger import AsyncEFSPurger
+
+    info = AsyncEFSPurger(root_path="/tmp/test", max_age_days=30, log_level="INFO")
+    debug = AsyncEFSPurger(root_path="/tmp/test", max_age_days=30, log_level="DEBUG")
+
+    assert info._debug_enabled is False
+    assert debug._debug_enabled is True
+
+
+@pytest.mark.asyncio
+async def test_io_executor_matches_concurrency():
+    """Test that the I/O thread pool is sized to the semaphore ceiling, not the default executor's cap."""
+    from efspurge.purger import AsyncEFSPurger
+
+    default = AsyncEFSPurger(root_path="/tmp/test", max_age_days=30)
+    small = AsyncEFSPurger(
+        root_path="/tmp/test", max_age_days=30, max_concurrency_scanning=4, max_concurrency_deletion=4
+    )
+
+    assert default.io_executor._max_workers == 1000
+    assert small.io_executor._max_workers == 32
+    assert AsyncEFSPurger(root_path="/tmp/test", max_age_days=30, io_threads=64).io_executor._max_workers == 64
+
+    with pytest.raises(ValueError, match="io_threads"):
+        AsyncEFSPurger(root_path="/tmp/test", max_age_days=30, io_threads=0)
+
+
+def test_stats_support_attribute_and_item_access():
+    """Test that Stats counters work as attributes and through the old dict-style access."""
+    from efspurge.purger import Stats
+
+    stats = Stats()
+    stats.files_scanned += 2
+    stats["errors"] = 1
+
+    assert stats["files_scanned"] == 2
+    assert stats.errors == 1
+    assert stats.get("peak_memory_mb", 0) == 0
+    assert "dirs_scanned" in stats
+    assert "get" not in stats
+    assert stats.as_dict()["files_scanned"] == 2
+    with pytest.raises(KeyError):
+        stats["unknown"]
+
+
+def test_memory_usage_reuses_process_handle(monkeypatch):
+    """Test that the psutil fallback reuses a single psutil.Process handle."""
+    from efspurge import purger
+
+    monkeypatch.setattr(purger, "_HAS_STATM", False)
+    first = purger.get_memory_usage_mb()
+    handle = purger._process_handle
+    second = purger.get_memory_usage_mb()
+
+    assert first > 0
+    assert second > 0
+    assert handle is not None
+    assert purger._process_handle is handle
+
+
+def test_memory_usage_falls_back_without_psutil(monkeypatch):
+    """Test the fallback chain when neither /proc statm nor psutil is available."""
+    from efspurge import purger
+
+    monkeypatch.setattr(purger, "_HAS_STATM", False)
+    monkeypatch.setattr(purger, "psutil", None)
+    if purger.resource is not None:
+        assert purger.get_memory_usage_mb() > 0
+
+    monkeypatch.setattr(purger, "resource", None)
+    assert purger.get_memory_usage_mb() == 0.0
+
+
+def test_memory_usage_statm_fast_path():
+    """Test that the /proc statm fast path reuses one fd and agrees with psutil."""
+    import os
+
+    from efspurge import purger
+
+    if not purger._HAS_STATM:
+        pytest.skip("/proc/self/statm not available")
+
+    first = purger.get_memory_usage_mb()
+    fd = purger._statm_fd
+    second = purger.get_memory_usage_mb()
+    rss_mb = purger._get_process().memory_info().rss / 1024 / 1024
+
+    assert fd is not None
+    assert purger._statm_fd == fd
+    assert purger._statm_pid == os.getpid()
+    assert first > 0
+    assert abs(second - rss_mb) < 5
+
+
+def test_run_async_returns_result():
+    """Test that run_async runs a coroutine with or without uvloop installed."""
+    from efspurge.purger import run_async
+
+    async def answer():
+        return 42
+
+    assert run_async(answer()) == 42
@@ -1,5 +1,7 @@
 """Tests for concurrent empty directory removal."""
 
+import asyncio
+import os
 import tempfile
 import time
 from pathlib import Path
@@ -112,6 +114,9 @@ async def test_concurrent_cascading_deletion(temp_dir):
     for i in range(10):
         assert not (temp_dir / f"flat_{i}").exists()
 
+    # Every pass cancels its workers before returning
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
 
 @pytest.mark.asyncio
 async def test_concurrent_deletion_no_duplicates(temp_dir):
@@ -191,10 +196,8 @@ async def test_concurrent_deletion_handles_already_deleted(temp_dir):
     await purger.scan_directory(temp_dir)
 
     # Manually delete some directories to simulate race condition
-    import aiofiles
-
     for i in range(5):
-        await aiofiles.os.rmdir(temp_dir / f"empty_{i}")
+        os.rmdir(temp_dir / f"empty_{i}")
 
     # Should handle gracefully
     await purger._remove_empty_directories()
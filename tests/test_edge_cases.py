@@ -1,13 +1,15 @@
 """Edge case tests for AsyncEFSPurge."""
 
+import asyncio
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from efspurge.purger import AsyncEFSPurger
+from efspurge.purger import SYSCALL_BATCH_SIZE, AsyncEFSPurger, _lstat_many, _open_dir_fds, _remove_many
 
 
 @pytest.fixture
@@ -17,16 +19,23 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+def create_file(path: str | os.PathLike, data: bytes, mtime: float | None = None) -> None:
+    """Write path and, if given, set its mtime (and atime) through the same descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        if mtime is not None:
+            os.utime(fd, (mtime, mtime))
+    finally:
+        os.close(fd)
+
+
 @pytest.mark.asyncio
 async def test_file_deleted_during_processing(temp_dir):
     """Test handling of file deleted between stat and remove."""
-    # Create a file
+    # Create an old file (31 days ago)
     test_file = temp_dir / "test.txt"
-    test_file.write_text("test")
-
-    # Make it old
-    old_time = time.time() - (31 * 86400)  # 31 days ago
-    os.utime(test_file, (old_time, old_time))
+    create_file(test_file, b"test", time.time() - (31 * 86400))
 
     purger = AsyncEFSPurger(
         root_path=str(temp_dir),
@@ -40,7 +49,7 @@ async def test_file_deleted_during_processing(temp_dir):
     test_file.unlink()
 
     # Process should handle gracefully (FileNotFoundError caught)
-    await purger.process_file(test_file)
+    await purger._process_file_paths([str(test_file)])
 
     # File was deleted before stat, so files_scanned won't increment
     # But should not crash - this is the expected behavior
@@ -48,6 +57,247 @@ async def test_file_deleted_during_processing(temp_dir):
     assert purger.stats["errors"] == 0  # FileNotFoundError is handled gracefully
 
 
+def test_lstat_many_returns_errors_in_place(temp_dir):
+    """Test that a failed lstat in a batch doesn't hide the results of the others."""
+    present = temp_dir / "present.txt"
+    present.write_text("test")
+    missing = temp_dir / "missing.txt"
+
+    results = _lstat_many([present, missing, present])
+
+    assert results[0].st_size == 4
+    assert isinstance(results[1], FileNotFoundError)
+    assert results[2].st_size == 4
+
+
+def test_remove_many_reports_each_failure(temp_dir):
+    """Test that the batched remove helper reports a failed unlink without stopping the rest."""
+    first = temp_dir / "first.txt"
+    first.write_text("test")
+    second = temp_dir / "second.txt"
+    second.write_text("test")
+    missing = temp_dir / "missing.txt"
+
+    results = _remove_many([str(first), str(missing), str(second)])
+
+    assert results[0] is None
+    assert isinstance(results[1], FileNotFoundError)
+    assert results[2] is None
+    assert list(temp_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_file_batch_stats_and_removes_relative_to_dir_fd(temp_dir, monkeypatch):
+    """Test that a batch stats and unlinks files by name against one descriptor for their directory."""
+    old_time = time.time() - (31 * 86400)
+    paths = []
+    for i in range(5):
+        path = temp_dir / f"file_{i}.txt"
+        create_file(path, b"test", old_time)
+        paths.append(str(path))
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=False)
+
+    opened = []
+    unlinked = []
+    original_open_dir_fds = _open_dir_fds
+    original_unlink = os.unlink
+
+    def tracking_open_dir_fds(directories):
+        dir_fds = original_open_dir_fds(directories)
+        opened.append(dict(dir_fds))
+        return dir_fds
+
+    def tracking_unlink(path, *, dir_fd=None):
+        unlinked.append((path, dir_fd))
+        original_unlink(path, dir_fd=dir_fd)
+
+    monkeypatch.setattr("efspurge.purger._open_dir_fds", tracking_open_dir_fds)
+    monkeypatch.setattr(os, "unlink", tracking_unlink)
+    await purger._process_file_paths(paths)
+
+    assert purger.stats["files_purged"] == 5
+    assert not any(temp_dir.iterdir())
+    if opened[0]:
+        dir_fd = opened[0][str(temp_dir)]
+        assert sorted(unlinked) == [(f"file_{i}.txt", dir_fd) for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_batched_stat_uses_one_hop_per_chunk(temp_dir):
+    """Test that file batches are stat-ed with one executor call per SYSCALL_BATCH_SIZE files."""
+    file_count = SYSCALL_BATCH_SIZE * 3 + 1
+    for i in range(file_count):
+        (temp_dir / f"file_{i}.txt").write_text("test")
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=True)
+
+    calls = []
+    original_submit = purger.io_executor.submit
+
+    def counting_submit(fn, *args, **kwargs):
+        calls.append(fn)
+        return original_submit(fn, *args, **kwargs)
+
+    purger.io_executor.submit = counting_submit
+    await purger._process_file_paths(sorted(temp_dir.iterdir()))
+
+    assert purger.stats["files_scanned"] == file_count
+    assert calls.count(_lstat_many) == 4
+    assert os.lstat not in calls
+
+
+@pytest.mark.asyncio
+async def test_batched_remove_uses_one_hop_per_chunk(temp_dir):
+    """Test that a batch is stat-ed and its old files unlinked in one executor call each per chunk."""
+    file_count = SYSCALL_BATCH_SIZE * 2 + 1
+    old_time = time.time() - (31 * 86400)
+    for i in range(file_count):
+        create_file(temp_dir / f"file_{i}.txt", b"test", old_time)
+    create_file(temp_dir / "new.txt", b"new")
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=False)
+
+    calls = []
+    original_submit = purger.io_executor.submit
+
+    def counting_submit(fn, *args, **kwargs):
+        calls.append(fn)
+        return original_submit(fn, *args, **kwargs)
+
+    purger.io_executor.submit = counting_submit
+    await purger._process_file_paths(sorted(str(path) for path in temp_dir.iterdir()))
+
+    assert purger.stats["files_purged"] == file_count
+    assert purger.stats["bytes_freed"] == file_count * 4
+    assert calls.count(_lstat_many) == 3
+    assert calls.count(_remove_many) == 3
+    assert [path.name for path in temp_dir.iterdir()] == ["new.txt"]
+
+
+@pytest.mark.asyncio
+async def test_chunks_without_old_files_skip_deletion_permits(temp_dir):
+    """Test that scanning files with nothing to remove never waits on a deletion permit."""
+    for i in range(SYSCALL_BATCH_SIZE * 2):
+        create_file(temp_dir / f"file_{i}.txt", b"new")
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=False, max_concurrency_deletion=1)
+
+    # Hold the only deletion permit: a chunk that asked for one would block forever
+    await purger.deletion_semaphore.acquire()
+    async with asyncio.timeout(10):
+        await purger._process_file_paths(sorted(str(path) for path in temp_dir.iterdir()))
+
+    assert purger.stats["files_scanned"] == SYSCALL_BATCH_SIZE * 2
+    assert purger.stats["files_purged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_file_batch_checks_ages_without_per_file_coroutines(temp_dir):
+    """Test that a batch is age-checked inline from its batched lstat results, missing files included."""
+    old_time = time.time() - (31 * 86400)
+    for i in range(10):
+        create_file(temp_dir / f"file_{i}.txt", b"test", old_time if i % 2 else None)
+    missing = str(temp_dir / "missing.txt")
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=True)
+
+    await purger._process_file_paths(sorted(str(path) for path in temp_dir.iterdir()) + [missing])
+
+    assert purger.stats["files_scanned"] == 10
+    assert purger.stats["files_to_purge"] == 5
+    assert purger.stats["errors"] == 0  # A file gone before its lstat isn't an error
+    assert purger.active_tasks == 0
+    assert purger.max_active_tasks == 11
+
+
+@pytest.mark.asyncio
+async def test_chunk_tasks_created_only_as_scanning_permits_free(temp_dir):
+    """Test that a batch never has more chunk tasks alive than there are scanning permits."""
+    file_count = SYSCALL_BATCH_SIZE * 6
+    for i in range(file_count):
+        (temp_dir / f"file_{i}.txt").write_text("test")
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=True, max_concurrency_scanning=2)
+
+    alive = 0
+    peak = 0
+    original_chunk = purger._process_file_chunk
+
+    async def tracking_chunk(*args):
+        nonlocal alive, peak
+        alive += 1
+        peak = max(peak, alive)
+        try:
+            await original_chunk(*args)
+        finally:
+            alive -= 1
+
+    purger._process_file_chunk = tracking_chunk
+    await purger._process_file_paths(sorted(str(path) for path in temp_dir.iterdir()))
+
+    assert purger.stats["files_scanned"] == file_count
+    assert peak <= 2
+    assert purger.scanning_semaphore.active == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_returns_every_scanning_permit(temp_dir):
+    """Test that chunks cancelled before they start still give back their scanning permits."""
+    file_count = SYSCALL_BATCH_SIZE * 6
+    for i in range(file_count):
+        (temp_dir / f"file_{i}.txt").write_text("test")
+
+    class FailingExecutor(ThreadPoolExecutor):
+        """Fails every stat hop synchronously, inside the chunk task's first step."""
+
+        def submit(self, fn, /, *args, **kwargs):
+            if fn is _lstat_many:
+                raise RuntimeError("executor unavailable")
+            return super().submit(fn, *args, **kwargs)
+
+    # One permit: the failing chunk's release wakes the batch, which creates the next chunk task
+    # before the TaskGroup sees the failure and cancels it
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=True, max_concurrency_scanning=1)
+    purger.io_executor = FailingExecutor(max_workers=2)
+    try:
+        with pytest.raises(ExceptionGroup):
+            await purger._process_file_paths(sorted(str(path) for path in temp_dir.iterdir()))
+    finally:
+        purger.io_executor.shutdown()
+
+    assert purger.scanning_semaphore.active == 0
+    assert purger.active_tasks == 0
+
+
+@pytest.mark.asyncio
+async def test_file_counters_merged_per_batch(temp_dir):
+    """Test that a file batch updates shared stats in bulk rather than once per file."""
+    old_time = time.time() - (31 * 86400)
+    for i in range(200):
+        create_file(temp_dir / f"file_{i}.txt", b"test", old_time if i % 2 else None)
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=False)
+
+    update_calls = 0
+    original_update = purger.update_stats
+
+    def counting_update(**kwargs):
+        nonlocal update_calls
+        update_calls += 1
+        original_update(**kwargs)
+
+    purger.update_stats = counting_update
+    await purger._process_file_paths(sorted(temp_dir.iterdir()))
+
+    assert update_calls == 1
+    assert purger.stats["files_scanned"] == 200
+    assert purger.stats["files_to_purge"] == 100
+    assert purger.stats["files_purged"] == 100
+    assert purger.stats["bytes_freed"] == 400
+    assert purger.rate_tracker.phase_counts["deletion"]["files"] == 100
+
+
 @pytest.mark.asyncio
 async def test_symlink_skipped(temp_dir):
     """Test that symlinks are skipped."""
@@ -72,6 +322,28 @@ async def test_symlink_skipped(temp_dir):
     assert purger.stats["files_scanned"] == 1
 
 
+@pytest.mark.asyncio
+async def test_symlink_detection_uses_dirent_type(temp_dir, monkeypatch):
+    """Test that symlinks (to files and directories) are detected without an islink call per entry."""
+    (temp_dir / "real.txt").write_text("content")
+    (temp_dir / "real_dir").mkdir()
+    (temp_dir / "file_link").symlink_to(temp_dir / "real.txt")
+    (temp_dir / "dir_link").symlink_to(temp_dir / "real_dir")
+
+    def fail_islink(path):
+        raise AssertionError(f"islink called for {path}")
+
+    monkeypatch.setattr(os.path, "islink", fail_islink)
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, dry_run=True)
+    await purger.scan_directory(temp_dir)
+
+    assert purger.stats["symlinks_skipped"] == 2
+    assert purger.stats["files_scanned"] == 1
+    assert purger.stats["dirs_scanned"] == 2
+    assert purger.stats["errors"] == 0
+
+
 @pytest.mark.asyncio
 async def test_permission_denied(temp_dir):
     """Test handling of permission denied errors."""
@@ -132,41 +404,33 @@ async def test_nested_directories(temp_dir):
     assert purger.stats["dirs_scanned"] == 4  # root + 3 levels
 
 
-@pytest.mark.asyncio
-async def test_very_large_batch_size(temp_dir):
-    """Test with very large batch size."""
-    # Create many files
-    for i in range(100):
-        (temp_dir / f"file{i}.txt").write_text(f"content{i}")
-
-    purger = AsyncEFSPurger(
-        root_path=str(temp_dir),
-        max_age_days=30,
-        task_batch_size=10000,  # Larger than file count
-    )
-
-    await purger.scan_directory(temp_dir)
-
-    # Should process all files
-    assert purger.stats["files_scanned"] == 100
+@pytest.fixture(scope="module")
+def hundred_files_dir():
+    """A directory of 100 new files, shared by tests that only scan it (dry run)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(100):
+            create_file(os.path.join(tmpdir, f"file{i}.txt"), f"content{i}".encode())
+        yield Path(tmpdir)
 
 
 @pytest.mark.asyncio
-async def test_small_batch_size(temp_dir):
-    """Test with small batch size."""
-    # Create many files
-    for i in range(100):
-        (temp_dir / f"file{i}.txt").write_text(f"content{i}")
-
+@pytest.mark.parametrize(
+    "task_batch_size",
+    [
+        10000,  # Larger than file count: one batch
+        10,  # Small: multiple batches
+    ],
+)
+async def test_batch_size(hundred_files_dir, task_batch_size):
+    """Test that every file is scanned whether the batch size is above or below the file count."""
     purger = AsyncEFSPurger(
-        root_path=str(temp_dir),
+        root_path=str(hundred_files_dir),
         max_age_days=30,
-        task_batch_size=10,  # Small batch
+        task_batch_size=task_batch_size,
     )
 
-    await purger.scan_directory(temp_dir)
+    await purger.scan_directory(hundred_files_dir)
 
-    # Should process all files in multiple batches
     assert purger.stats["files_scanned"] == 100
 
 
@@ -175,9 +439,7 @@ async def test_dry_run_no_deletion(temp_dir):
     """Test that dry-run doesn't delete files."""
     # Create old file
     old_file = temp_dir / "old.txt"
-    old_file.write_text("old content")
-    old_time = time.time() - (31 * 86400)
-    os.utime(old_file, (old_time, old_time))
+    create_file(old_file, b"old content", time.time() - (31 * 86400))
 
     purger = AsyncEFSPurger(
         root_path=str(temp_dir),
@@ -198,13 +460,11 @@ async def test_actual_deletion(temp_dir):
     """Test that actual deletion works."""
     # Create old file
     old_file = temp_dir / "old.txt"
-    old_file.write_text("old content")
-    old_time = time.time() - (31 * 86400)
-    os.utime(old_file, (old_time, old_time))
+    create_file(old_file, b"old content", time.time() - (31 * 86400))
 
     # Create new file
     new_file = temp_dir / "new.txt"
-    new_file.write_text("new content")
+    create_file(new_file, b"new content")
 
     purger = AsyncEFSPurger(
         root_path=str(temp_dir),
@@ -225,7 +485,7 @@ async def test_concurrent_file_processing(temp_dir):
     """Test concurrent file processing."""
     # Create many files
     for i in range(50):
-        (temp_dir / f"file{i}.txt").write_text(f"content{i}")
+        create_file(temp_dir / f"file{i}.txt", f"content{i}".encode())
 
     purger = AsyncEFSPurger(
         root_path=str(temp_dir),
@@ -255,7 +515,7 @@ async def test_nonexistent_path():
 async def test_memory_limit_zero(temp_dir):
     """Test with memory limit disabled (0)."""
     for i in range(10):
-        (temp_dir / f"file{i}.txt").write_text(f"content{i}")
+        create_file(temp_dir / f"file{i}.txt", f"content{i}".encode())
 
     purger = AsyncEFSPurger(
         root_path=str(temp_dir),
@@ -1,11 +1,12 @@
 """Tests for empty directory removal feature."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from efspurge.purger import AsyncEFSPurger
+from efspurge.purger import AsyncEFSPurger, _path_depth, async_is_empty_dir
 
 
 @pytest.fixture
@@ -221,3 +222,102 @@ async def test_multiple_empty_dirs(temp_dir):
     assert purger.stats["empty_dirs_deleted"] == 5
     for i in range(5):
         assert not (temp_dir / f"empty{i}").exists()
+
+
+@pytest.mark.asyncio
+async def test_empty_dirs_record_depth(temp_dir):
+    """Test that empty directories are stored with their depth for deepest-first sorting."""
+    shallow = temp_dir / "shallow"
+    deep = temp_dir / "a" / "b" / "deep"
+    shallow.mkdir()
+    deep.mkdir(parents=True)
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        remove_empty_dirs=True,
+    )
+
+    await purger.scan_directory(temp_dir)
+
+    assert set(purger.empty_dirs) == {str(shallow), str(deep)}
+    assert purger.empty_dirs[str(deep)] - purger.empty_dirs[str(shallow)] == 2
+
+
+def test_path_depth_accepts_str_bytes_and_path():
+    """Test that depth is the same whether the path is a str, bytes or Path."""
+    path = "/data/a/b"
+    assert _path_depth(path) == 3
+    assert _path_depth(os.fsencode(path)) == 3
+    assert _path_depth(Path(path)) == 3
+
+
+def test_filesystem_root_is_never_under_root():
+    """Test that root "/" isn't treated as inside itself (its prefix is the root itself)."""
+    purger = AsyncEFSPurger(root_path="/", max_age_days=30)
+
+    assert not purger._is_under_root("/")
+    assert purger._is_under_root("/data")
+    assert purger._is_under_root("/data/empty")
+
+
+@pytest.mark.asyncio
+async def test_root_given_as_symlink_never_removed(temp_dir):
+    """Test that the root is protected when it is reached through a symlink."""
+    real_root = temp_dir / "real"
+    (real_root / "a" / "b").mkdir(parents=True)
+    link_root = temp_dir / "link"
+    link_root.symlink_to(real_root)
+
+    purger = AsyncEFSPurger(
+        root_path=str(link_root),
+        max_age_days=30,
+        remove_empty_dirs=True,
+        max_empty_dirs_to_delete=0,
+        dry_run=False,
+    )
+
+    await purger.purge()
+
+    # a/b and then a are removed by the cascade, the root itself is kept
+    assert purger.stats["empty_dirs_deleted"] == 2
+    assert real_root.exists()
+    assert list(real_root.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_cascade_skips_non_empty_parents_without_errors(temp_dir):
+    """Test that speculatively queued parents refused with ENOTEMPTY are retried or kept, not errors."""
+    # p is queued after p/a goes, possibly before p/b is removed; keep still holds a file
+    (temp_dir / "p" / "a").mkdir(parents=True)
+    (temp_dir / "p" / "b" / "c").mkdir(parents=True)
+    (temp_dir / "keep" / "empty").mkdir(parents=True)
+    (temp_dir / "keep" / "new.txt").write_text("new")
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        remove_empty_dirs=True,
+        max_empty_dirs_to_delete=0,
+        dry_run=False,
+    )
+
+    await purger.purge()
+
+    assert purger.stats["empty_dirs_deleted"] == 5  # p/a, p/b/c, p/b, p and keep/empty
+    assert purger.stats["errors"] == 0
+    assert not (temp_dir / "p").exists()
+    assert sorted(os.listdir(temp_dir / "keep")) == ["new.txt"]
+
+
+@pytest.mark.asyncio
+async def test_async_is_empty_dir(temp_dir):
+    """Test the single-entry emptiness check used when collecting empty directories."""
+    assert await async_is_empty_dir(temp_dir)
+
+    for i in range(100):
+        (temp_dir / f"file{i}.txt").write_text("x")
+    assert not await async_is_empty_dir(str(temp_dir))
+
+    with pytest.raises(FileNotFoundError):
+        await async_is_empty_dir(temp_dir / "missing")
@@ -1,12 +1,13 @@
 """Tests for race conditions in empty directory removal."""
 
+import errno
+import os
 import tempfile
 from pathlib import Path
 
-import aiofiles
 import pytest
 
-from efspurge.purger import AsyncEFSPurger, async_scandir
+from efspurge.purger import AsyncEFSPurger
 
 
 @pytest.fixture
@@ -104,37 +105,32 @@ async def test_cascading_deletion_no_duplicates(temp_dir):
 
     async def mock_remove():
         # Get initial set
-        async with purger.stats_lock:
-            initial = set(purger.empty_dirs)
+        initial = set(purger.empty_dirs)
 
         # Process and track
         for d in sorted(initial, key=lambda p: len(p.parts), reverse=True):
             if d not in deletion_attempts:
                 deletion_attempts.append(d)
                 if not purger.dry_run:
-                    await aiofiles.os.rmdir(d)
-                await purger.update_stats(empty_dirs_deleted=1)
+                    os.rmdir(d)
+                purger.update_stats(empty_dirs_deleted=1)
 
-        # Check parents (cascading)
+        # Queue parents (cascading) without listing them - rmdir refuses non-empty ones
         processed = set(deletion_attempts)
-        new_parents = set()
-        for d in deletion_attempts:
-            parent = d.parent
-            if parent != temp_dir and parent not in processed:
-                try:
-                    entries = await async_scandir(parent)
-                    if len(entries) == 0:
-                        new_parents.add(parent)
-                except Exception:
-                    pass
+        new_parents = {d.parent for d in deletion_attempts if d.parent != temp_dir and d.parent not in processed}
 
         # Process new parents
         for parent in sorted(new_parents, key=lambda p: len(p.parts), reverse=True):
             if parent not in deletion_attempts:
                 deletion_attempts.append(parent)
-                if not purger.dry_run:
-                    await aiofiles.os.rmdir(parent)
-                await purger.update_stats(empty_dirs_deleted=1)
+                try:
+                    if not purger.dry_run:
+                        os.rmdir(parent)
+                except OSError as e:
+                    if e.errno != errno.ENOTEMPTY:
+                        raise
+                    continue
+                purger.update_stats(empty_dirs_deleted=1)
 
     # Use actual implementation but verify no duplicates
     await purger._remove_empty_directories()
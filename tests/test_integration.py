@@ -4,6 +4,7 @@ import asyncio
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -11,38 +12,60 @@ import pytest
 from efspurge.purger import AsyncEFSPurger
 
 
+def create_files(directory: Path, files: range, content_prefix: str, old_count: int = 0) -> None:
+    """
+    Create file{i}.txt for each i in files inside directory; those with i < old_count are 31 days old.
+
+    Files are opened relative to one directory fd and aged through their own fd, so no
+    Path objects are built and no name is looked up twice.
+    """
+    old_time = time.time() - (31 * 86400)
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for i in files:
+            fd = os.open(f"file{i}.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+            try:
+                os.write(fd, f"{content_prefix}{i}".encode())
+                if i < old_count:
+                    os.utime(fd, (old_time, old_time))
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+
+
+def count_txt_files(directory: Path) -> int:
+    """Count the .txt files directly in directory without building Path objects."""
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(".txt"))
+
+
 @pytest.fixture
 def large_test_structure():
     """Create a large test directory structure."""
     with tempfile.TemporaryDirectory() as tmpdir:
         base = Path(tmpdir)
 
-        # Create flat directory with many files
+        # Flat directory with many files (50% old), and a nested structure whose first 5 of 10
+        # dirs hold only old files
         flat_dir = base / "flat"
-        flat_dir.mkdir()
-        for i in range(1000):
-            (flat_dir / f"file{i}.txt").write_text(f"content{i}")
-
-        # Create nested directory structure
         nested_dir = base / "nested"
-        nested_dir.mkdir()
-        for dir_num in range(10):
-            subdir = nested_dir / f"dir{dir_num}"
-            subdir.mkdir()
-            for file_num in range(100):
-                (subdir / f"file{file_num}.txt").write_text(f"content{dir_num}_{file_num}")
-
-        # Make some files old
-        old_time = time.time() - (31 * 86400)  # 31 days ago
-
-        # Make 50% of flat files old
-        for i in range(500):
-            os.utime(flat_dir / f"file{i}.txt", (old_time, old_time))
-
-        # Make 50% of nested files old
-        for dir_num in range(5):
-            for file_num in range(100):
-                os.utime(nested_dir / f"dir{dir_num}" / f"file{file_num}.txt", (old_time, old_time))
+        subdirs = [nested_dir / f"dir{dir_num}" for dir_num in range(10)]
+        for directory in [flat_dir, *subdirs]:
+            directory.mkdir(parents=True)
+
+        # File creation is latency-bound, so fill directories (and slices of the flat one) in parallel
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            jobs = [
+                executor.submit(create_files, flat_dir, range(start, start + 250), "content", 500)
+                for start in range(0, 1000, 250)
+            ]
+            jobs += [
+                executor.submit(create_files, subdir, range(100), f"content{dir_num}_", 100 if dir_num < 5 else 0)
+                for dir_num, subdir in enumerate(subdirs)
+            ]
+            for job in jobs:
+                job.result()
 
         yield base
 
@@ -104,7 +127,7 @@ async def test_actual_deletion_large_structure(large_test_structure):
     flat_dir = large_test_structure / "flat"
 
     # Count files before
-    files_before = len(list(flat_dir.glob("*.txt")))
+    files_before = count_txt_files(flat_dir)
     assert files_before == 1000
 
     purger = AsyncEFSPurger(
@@ -120,7 +143,7 @@ async def test_actual_deletion_large_structure(large_test_structure):
     stats = await purger.purge()
 
     # Count files after
-    files_after = len(list(flat_dir.glob("*.txt")))
+    files_after = count_txt_files(flat_dir)
 
     assert stats["files_scanned"] == 1000
     assert stats["files_purged"] == 500
@@ -193,20 +216,18 @@ async def test_progress_updates(large_test_structure):
         dry_run=True,
     )
 
-    # Start purge
+    # Sample the counters on every event-loop turn while the purge runs (each directory's batch
+    # is merged into stats as it finishes), instead of sleeping for a fixed time
+    total = 1000
     task = asyncio.create_task(purger.purge())
-
-    # Wait a bit
-    await asyncio.sleep(0.5)
-
-    # Check that progress reporter is running
-    # (stats should be updating)
-
-    # Wait a bit more
-    await asyncio.sleep(0.5)
-
-    # Should have processed more files
-    await task  # Wait for completion
-
+    seen = []
+    async with asyncio.timeout(30):
+        while not task.done():
+            seen.append(purger.stats["files_scanned"])
+            await asyncio.sleep(0)
     stats = await task
-    assert stats["files_scanned"] == 1000
+
+    # Progress is visible mid-run, and only ever grows
+    assert any(0 < files_scanned < total for files_scanned in seen), f"No partial progress observed: {set(seen)}"
+    assert seen == sorted(seen)
+    assert stats["files_scanned"] == total
@@ -5,17 +5,22 @@ These tests verify that:
 2. Empty directory removal logs appear when enabled
 3. Empty directory removal logs don't appear when disabled
 4. Startup log includes remove_empty_dirs setting
+5. JSON log lines decode the same with or without orjson
 
 Note: These tests verify the code structure and behavior rather than
 capturing actual log output, since logs go directly to stdout as JSON.
 """
 
+import json
+import logging
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+import efspurge.logging as efspurge_logging
+from efspurge.logging import JsonFormatter
 from efspurge.purger import AsyncEFSPurger
 
 
@@ -48,7 +53,7 @@ async def test_no_duplicate_progress_logging_code(temp_dir):
 
     # Call update_stats multiple times
     for _ in range(10):
-        await purger.update_stats(files_scanned=1)
+        purger.update_stats(files_scanned=1)
 
     # Should NOT have any "Progress update" logs from update_stats
     progress_logs = [call for call in log_calls if "Progress update" in str(call)]
@@ -205,3 +210,21 @@ async def test_active_directories_tracked_during_scan(temp_dir):
     assert len(purger.active_directories) == 0, (
         f"active_directories should be empty after scan completes. Still tracking: {purger.active_directories}"
     )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_formatter_output_with_and_without_orjson(monkeypatch, use_orjson):
+    """Test that log lines decode to the same object whichever JSON encoder is used."""
+    if not use_orjson:
+        monkeypatch.setattr(efspurge_logging, "orjson", None)
+    elif efspurge_logging.orjson is None:
+        pytest.skip("orjson not installed")
+
+    record = logging.LogRecord("efspurge", logging.INFO, __file__, 1, "Progress update", None, None)
+    record.extra_fields = {"files_scanned": 10, "memory_mb": 12.5, "path": "/data/é", "huge": 2**70}
+
+    line = JsonFormatter().format(record)
+
+    decoded = json.loads(line)
+    assert decoded["message"] == "Progress update"
+    assert decoded["extra_fields"] == record.extra_fields
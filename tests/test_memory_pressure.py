@@ -0,0 +1,225 @@
+"""Tests for the memory back-pressure state machine."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import efspurge.purger as purger_module
+from efspurge.purger import AsyncEFSPurger, BackpressureState, _ResizableQueue, _ResizableSemaphore
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def fake_memory(monkeypatch):
+    """Control the RSS the purger sees and sample on every call."""
+    reading = {"mb": 0.0, "calls": 0}
+
+    def fake_usage():
+        reading["calls"] += 1
+        return reading["mb"]
+
+    monkeypatch.setattr(purger_module, "get_memory_usage_mb", fake_usage)
+    monkeypatch.setattr(purger_module, "MEMORY_SAMPLE_INTERVAL", 0.0)
+    return reading
+
+
+@pytest.mark.asyncio
+async def test_states_follow_memory_watermarks(temp_dir, fake_memory):
+    """Test that each watermark maps to its state and queue capacity."""
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, memory_limit_mb=100)
+    queue = _ResizableQueue(maxsize=100)
+    purger._throttle_queue(queue)
+
+    expected = [
+        (50, BackpressureState.NORMAL, 100, False),
+        (75, BackpressureState.ELEVATED, 75, False),
+        (90, BackpressureState.CRITICAL, 50, True),
+        (97, BackpressureState.BLOCKED, 1, True),
+        (40, BackpressureState.NORMAL, 100, False),
+    ]
+    for memory_mb, state, capacity, is_high in expected:
+        fake_memory["mb"] = memory_mb
+        assert await purger.check_memory_pressure() == (is_high, memory_mb)
+        assert purger.memory_pressure_state is state
+        assert queue.maxsize == capacity
+
+    # One event per sample at CRITICAL or above
+    assert purger.stats["memory_backpressure_events"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits_follow_memory_state(temp_dir, fake_memory):
+    """Test that stat/delete concurrency is halved under pressure (with a floor) and restored at NORMAL."""
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        memory_limit_mb=100,
+        max_concurrency_scanning=1000,
+        max_concurrency_deletion=100,
+    )
+
+    fake_memory["mb"] = 75
+    await purger.check_memory_pressure()
+    assert purger.scanning_semaphore.limit == 500
+    assert purger.deletion_semaphore.limit == 64
+
+    fake_memory["mb"] = 40
+    await purger.check_memory_pressure()
+    assert purger.scanning_semaphore.limit == 1000
+    assert purger.deletion_semaphore.limit == 100
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_backs_off_on_latency_and_recovers(temp_dir):
+    """Test that rising I/O latency halves the limits (down to the floor) and recovery grows them back."""
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        max_concurrency_scanning=1000,
+        max_concurrency_deletion=1000,
+        adaptive_concurrency=True,
+    )
+
+    await purger._adjust_concurrency_for_latency()  # No samples yet: nothing to go on
+    assert purger.scanning_semaphore.limit == 1000
+
+    purger._record_io_latency(0.001)
+    await purger._adjust_concurrency_for_latency()  # Sets the baseline
+    assert purger.scanning_semaphore.limit == 1000
+
+    for _ in range(20):
+        purger._record_io_latency(0.01)
+    await purger._adjust_concurrency_for_latency()
+    assert purger.scanning_semaphore.limit == 500
+    assert purger.deletion_semaphore.limit == 500
+
+    for _ in range(5):
+        await purger._adjust_concurrency_for_latency()
+    assert purger._latency_factor == purger_module.MIN_LATENCY_FACTOR
+    assert purger.scanning_semaphore.limit == purger_module.MIN_THROTTLED_CONCURRENCY
+
+    for _ in range(40):
+        purger._record_io_latency(0.001)
+    await purger._adjust_concurrency_for_latency()
+    assert purger.scanning_semaphore.limit == int(1000 * (purger_module.MIN_LATENCY_FACTOR + 0.1))
+
+
+@pytest.mark.asyncio
+async def test_resizable_semaphore_shrinks_and_wakes_waiters():
+    """Test that a lowered limit holds back new acquirers until holders release or the limit grows."""
+    semaphore = _ResizableSemaphore(2)
+    await semaphore.acquire()
+    await semaphore.acquire()
+    await semaphore.set_limit(1)
+    await semaphore.release()
+
+    waiter = asyncio.create_task(semaphore.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await semaphore.set_limit(2)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert semaphore.active == 2
+
+
+@pytest.mark.asyncio
+async def test_resizable_queue_shrinks_and_wakes_putters():
+    """Test that a lowered maxsize blocks new puts until items are taken or the maxsize grows."""
+    queue = _ResizableQueue(maxsize=2)
+    queue.put_nowait(1)
+    queue.set_maxsize(1)
+    assert queue.full()
+
+    putter = asyncio.create_task(queue.put(2))
+    await asyncio.sleep(0)
+    assert not putter.done()
+
+    queue.set_maxsize(2)
+    await asyncio.wait_for(putter, timeout=1)
+    assert queue.qsize() == 2 and queue.maxsize == 2
+
+
+def test_resizable_queue_peeks_in_fifo_order():
+    """Test that peek() returns the next item get() would, without removing it."""
+    queue = _ResizableQueue()
+    queue.put_nowait("first")
+    queue.put_nowait("second")
+
+    assert queue.peek() == "first"
+    assert queue.qsize() == 2
+    assert queue.get_nowait() == "first"
+    assert queue.peek() == "second"
+    queue.get_nowait()
+    assert queue.empty()
+    with pytest.raises(IndexError):
+        queue.peek()
+
+
+@pytest.mark.asyncio
+async def test_memory_sampled_at_most_once_per_interval(temp_dir, fake_memory, monkeypatch):
+    """Test that calls between samples reuse the cached state without reading RSS."""
+    monkeypatch.setattr(purger_module, "MEMORY_SAMPLE_INTERVAL", 60.0)
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, memory_limit_mb=100)
+
+    fake_memory["mb"] = 90
+    for _ in range(100):
+        assert await purger.check_memory_pressure() == (True, 90)
+
+    assert fake_memory["calls"] == 1
+    assert purger.stats["memory_backpressure_events"] == 1
+
+
+@pytest.mark.asyncio
+async def test_purge_reads_memory_only_in_background_sampler(temp_dir, fake_memory, monkeypatch):
+    """Test that during purge() directory workers use the sampler's reading instead of reading RSS."""
+    monkeypatch.setattr(purger_module, "MEMORY_SAMPLE_INTERVAL", 60.0)
+    for i in range(50):
+        (temp_dir / f"dir_{i:02d}").mkdir()
+
+    purger = AsyncEFSPurger(root_path=str(temp_dir), max_age_days=30, memory_limit_mb=100)
+    fake_memory["mb"] = 75
+    stats = await purger.purge()
+
+    assert stats["dirs_scanned"] == 51
+    assert fake_memory["calls"] == 2  # Up-front sample and final stats; the sampler never woke up
+    assert purger.memory_pressure_state is BackpressureState.ELEVATED
+    assert purger._memory_sampler_task is None
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_does_not_hang(temp_dir, fake_memory, monkeypatch):
+    """Test that empty dir removal returns promptly when memory crosses the critical threshold mid-run."""
+    for i in range(500):
+        (temp_dir / f"empty_{i:03d}").mkdir()
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        remove_empty_dirs=True,
+        memory_limit_mb=100,
+        max_empty_dirs_to_delete=0,
+        max_concurrency_deletion=10,
+        dry_run=False,
+    )
+    await purger.scan_directory(temp_dir)
+
+    # Memory spikes once the producer has queued some directories, so the breaker trips mid-run
+    def spiking_usage():
+        fake_memory["calls"] += 1
+        return 50 if fake_memory["calls"] <= 100 else 99
+
+    fake_memory["calls"] = 0
+    monkeypatch.setattr(purger_module, "get_memory_usage_mb", spiking_usage)
+    await asyncio.wait_for(purger._remove_empty_directories(), timeout=30)
+
+    assert purger.memory_pressure_state is BackpressureState.BLOCKED
+    assert purger.stats["empty_dirs_deleted"] < 500
+    assert not purger._throttled_queues
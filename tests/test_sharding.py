@@ -0,0 +1,135 @@
+"""Tests for sharded (multi-process) purging."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from efspurge.purger import _plan_shards, _split_limit, checkpoint_path, load_checkpoint, run_sharded
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def make_old(path: Path) -> None:
+    """Set a file's mtime to 60 days ago."""
+    old_time = time.time() - (60 * 86400)
+    os.utime(path, (old_time, old_time))
+
+
+def test_plan_shards_balances_by_entry_count(temp_dir):
+    """Test that top-level subdirectories are spread across shards by size."""
+    big = temp_dir / "big"
+    big.mkdir()
+    for i in range(10):
+        (big / f"file{i}.txt").write_text("x")
+    for name in ("small1", "small2", "small3"):
+        small = temp_dir / name
+        small.mkdir()
+        (small / "file.txt").write_text("x")
+    (temp_dir / "root_file.txt").write_text("x")
+
+    shards = _plan_shards(temp_dir, 2)
+
+    assert len(shards) == 2
+    assert shards[0] == [big]
+    assert sorted(shards[1]) == [temp_dir / "small1", temp_dir / "small2", temp_dir / "small3"]
+
+
+def test_plan_shards_capped_by_subdir_count(temp_dir):
+    """Test that there are never more shards than top-level subdirectories."""
+    (temp_dir / "only").mkdir()
+    assert len(_plan_shards(temp_dir, 8)) == 1
+
+    (temp_dir / "only").rmdir()
+    assert _plan_shards(temp_dir, 8) == [[]]
+
+
+def test_split_limit_never_exceeds_total():
+    """Test that per-shard limits add up to exactly the user's cap."""
+    assert _split_limit(500, 3) == [167, 167, 166]
+    assert _split_limit(2, 3) == [1, 1, 0]
+    assert _split_limit(9, 3) == [3, 3, 3]
+    assert all(sum(_split_limit(total, parts)) == total for total in range(1, 50) for parts in range(1, 9))
+
+
+def test_run_sharded_matches_single_process(temp_dir):
+    """Test that a sharded run scans and purges the same files as a single-process run."""
+    for i in range(4):
+        subdir = temp_dir / f"tenant{i}"
+        (subdir / "nested").mkdir(parents=True)
+        old_file = subdir / "nested" / "old.txt"
+        old_file.write_text("old")
+        make_old(old_file)
+        (subdir / "new.txt").write_text("new")
+    root_old = temp_dir / "root_old.txt"
+    root_old.write_text("old")
+    make_old(root_old)
+
+    stats = run_sharded(str(temp_dir), 3, max_age_days=30, dry_run=False)
+
+    assert stats["processes"] == 3
+    # Root is scanned once, by the shard that owns it
+    assert stats["dirs_scanned"] == 1 + 4 * 2
+    assert stats["files_scanned"] == 4 * 2 + 1
+    assert stats["files_purged"] == 4 + 1
+    assert stats["errors"] == 0
+    assert not root_old.exists()
+    assert all((temp_dir / f"tenant{i}" / "new.txt").exists() for i in range(4))
+    # Peak memory is the largest process's peak, not a sum reported under the same name
+    assert 0 < stats["peak_memory_mb"] < stats["total_peak_memory_mb"]
+
+
+def test_run_sharded_removes_empty_dirs_but_not_root(temp_dir):
+    """Test that empty directories are removed across shards and the root is kept."""
+    for i in range(3):
+        (temp_dir / f"tenant{i}" / "empty").mkdir(parents=True)
+
+    stats = run_sharded(str(temp_dir), 3, max_age_days=30, dry_run=False, remove_empty_dirs=True)
+
+    assert stats["dirs_purged"] == 6
+    assert temp_dir.exists()
+    assert list(temp_dir.iterdir()) == []
+
+
+def test_run_sharded_keeps_total_empty_dir_cap(temp_dir):
+    """Test that the shards together never remove more empty directories than the cap."""
+    for i in range(3):
+        (temp_dir / f"tenant{i}" / "empty").mkdir(parents=True)
+
+    stats = run_sharded(
+        str(temp_dir), 3, max_age_days=30, dry_run=False, remove_empty_dirs=True, max_empty_dirs_to_delete=2
+    )
+
+    assert stats["dirs_purged"] == 2
+    assert sum(1 for i in range(3) if (temp_dir / f"tenant{i}" / "empty").exists()) == 1
+
+
+def test_run_sharded_defaults_to_dry_run_without_checkpoint(temp_dir):
+    """Test that omitting dry_run runs every shard dry and records no checkpoint."""
+    root = temp_dir / "root"
+    for i in range(2):
+        old_file = root / f"tenant{i}" / "old.txt"
+        old_file.parent.mkdir(parents=True)
+        old_file.write_text("old")
+        make_old(old_file)
+
+    stats = run_sharded(str(root), 2, max_age_days=30, skip_unchanged_dirs=True)
+
+    assert stats["files_to_purge"] == 2
+    assert stats["files_purged"] == 0
+    assert all((root / f"tenant{i}" / "old.txt").exists() for i in range(2))
+    # A dry run deleted nothing, so the next run must not skip these directories
+    assert load_checkpoint(checkpoint_path(root)) is None
+
+
+def test_run_sharded_missing_path():
+    """Test that a missing root path is reported before any process is started."""
+    with pytest.raises(FileNotFoundError):
+        run_sharded("/nonexistent/efspurge-shard-test", 2, max_age_days=30)
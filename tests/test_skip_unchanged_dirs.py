@@ -0,0 +1,86 @@
+"""Tests for incremental runs that skip files of directories unchanged since the last scan."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from efspurge.purger import AsyncEFSPurger, checkpoint_path, load_checkpoint, save_checkpoint
+
+
+@pytest.fixture
+def root_dir():
+    """Create a purge root inside a temporary directory (the checkpoint is written beside it)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "root"
+        root.mkdir()
+        yield root
+
+
+def make_old(path: Path, days: float = 31) -> None:
+    """Set path's mtime days in the past."""
+    old_time = time.time() - days * 86400
+    os.utime(path, (old_time, old_time))
+
+
+def test_checkpoint_round_trip(root_dir):
+    """Test that the checkpoint lives beside the root and round-trips the scan start time."""
+    path = checkpoint_path(root_dir)
+
+    assert os.path.dirname(path) == str(root_dir.parent)
+    assert load_checkpoint(path) is None
+
+    save_checkpoint(path, 1234.5)
+    assert load_checkpoint(path) == 1234.5
+
+    Path(path).write_text("not json")
+    assert load_checkpoint(path) is None
+
+
+def test_skip_unchanged_dirs_rejects_remove_empty_dirs(root_dir):
+    """Test that skipping files can't be combined with empty-directory removal."""
+    with pytest.raises(ValueError, match="skip_unchanged_dirs"):
+        AsyncEFSPurger(root_path=str(root_dir), max_age_days=30, skip_unchanged_dirs=True, remove_empty_dirs=True)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_directory_files_are_skipped(root_dir):
+    """Test that files of an untouched directory are skipped while changed subdirectories are still scanned."""
+    unchanged = root_dir / "unchanged"
+    changed = unchanged / "changed"
+    changed.mkdir(parents=True)
+    for directory in (unchanged, changed):
+        old_file = directory / "old.txt"
+        old_file.write_text("old")
+        make_old(old_file)
+    make_old(unchanged, days=2)
+    make_old(root_dir, days=2)
+    save_checkpoint(checkpoint_path(root_dir), time.time() - 86400)
+
+    purger = AsyncEFSPurger(root_path=str(root_dir), max_age_days=30, dry_run=False, skip_unchanged_dirs=True)
+    stats = await purger.purge()
+
+    assert stats["dirs_scanned"] == 3
+    assert stats["unchanged_dirs_skipped"] == 2  # root and unchanged
+    assert stats["files_purged"] == 1
+    assert (unchanged / "old.txt").exists()
+    assert not (changed / "old.txt").exists()
+    # A successful run moves the checkpoint to its own start time
+    assert load_checkpoint(purger.checkpoint_path) >= time.time() - 60
+
+
+@pytest.mark.asyncio
+async def test_first_and_dry_runs_scan_everything(root_dir):
+    """Test that without a checkpoint every file is scanned, and that a dry run doesn't write one."""
+    old_file = root_dir / "old.txt"
+    old_file.write_text("old")
+    make_old(old_file)
+
+    purger = AsyncEFSPurger(root_path=str(root_dir), max_age_days=30, dry_run=True, skip_unchanged_dirs=True)
+    stats = await purger.purge()
+
+    assert stats["files_to_purge"] == 1
+    assert stats["unchanged_dirs_skipped"] == 0
+    assert load_checkpoint(purger.checkpoint_path) is None
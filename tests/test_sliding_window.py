@@ -116,8 +116,8 @@ async def test_buffer_cleared_after_processing(temp_dir):
         task_batch_size=batch_size,
     )
 
-    # Mock _process_file_batch to verify buffer clearing
-    original_process = purger._process_file_batch
+    # Wrap _process_file_paths to verify buffer clearing
+    original_process = purger._process_file_paths
     batch_sizes_seen = []
 
     async def mock_process(batch):
@@ -127,7 +127,7 @@ async def test_buffer_cleared_after_processing(temp_dir):
         # Note: We can't directly check buffer here, but we can verify
         # that batches are the right size
 
-    purger._process_file_batch = mock_process
+    purger._process_file_paths = mock_process
 
     await purger.scan_directory(temp_dir)
 
@@ -163,3 +163,63 @@ async def test_mixed_files_and_directories(temp_dir):
     # Should process all files (15 in root + 5 in subdirs)
     assert purger.stats["files_scanned"] == 20
     assert purger.stats["dirs_scanned"] == 6  # Root + 5 subdirs
+
+
+@pytest.mark.asyncio
+async def test_scanning_does_not_poll_memory(temp_dir):
+    """Test that file batches are throttled by the bounded queue, not per-batch memory polling."""
+    batch_size = 10
+    for i in range(batch_size * 5):
+        (temp_dir / f"file{i}.txt").write_text(f"content{i}")
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        task_batch_size=batch_size,
+        memory_limit_mb=800,
+    )
+
+    check_calls = 0
+    original_check = purger.check_memory_pressure
+
+    async def tracked_check():
+        nonlocal check_calls
+        check_calls += 1
+        return await original_check()
+
+    purger.check_memory_pressure = tracked_check
+
+    await purger.scan_directory(temp_dir)
+
+    assert purger.stats["files_scanned"] == batch_size * 5
+    assert check_calls == 0
+    # Pipeline is torn down once the scan returns
+    assert purger._file_batch_queue is None
+
+
+@pytest.mark.asyncio
+async def test_purged_files_leave_directory_empty(temp_dir):
+    """Test that a directory emptied by file purging is detected as empty in the same scan."""
+    import os
+    import time
+
+    subdir = temp_dir / "old_only"
+    subdir.mkdir()
+    old_time = time.time() - (60 * 86400)
+    for i in range(25):
+        old_file = subdir / f"file{i}.txt"
+        old_file.write_text("old")
+        os.utime(old_file, (old_time, old_time))
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        task_batch_size=10,
+        remove_empty_dirs=True,
+        dry_run=False,
+    )
+
+    await purger.scan_directory(temp_dir)
+
+    assert purger.stats["files_purged"] == 25
+    assert str(subdir) in purger.empty_dirs
@@ -3,10 +3,12 @@
 These tests verify that:
 1. Subdirectories are processed with constant concurrency (no idle slots)
 2. Slow directories don't block others
-3. Tasks are created on-demand (not all upfront) to prevent memory explosion
-4. The hybrid approach maintains high utilization
+3. A fixed worker pool is used (no task per directory) to prevent memory explosion
+4. The worker pool maintains high utilization
 """
 
+import asyncio
+import os
 import tempfile
 import time
 from pathlib import Path
@@ -48,7 +50,7 @@ async def test_subdir_concurrency_maintained(temp_dir):
 
     original_scan = purger.scan_directory
 
-    async def tracked_scan(directory: Path):
+    async def tracked_scan(directory: str):
         scan_start_times[str(directory)] = time.time()
         try:
             await original_scan(directory)
@@ -101,8 +103,8 @@ async def test_slow_directories_dont_block_others(temp_dir):
     completion_order = []
     original_scan = purger.scan_directory
 
-    async def tracked_scan(directory: Path):
-        dir_name = directory.name
+    async def tracked_scan(directory: str):
+        dir_name = os.path.basename(directory)
         await original_scan(directory)
         completion_order.append(dir_name)
 
@@ -125,7 +127,7 @@ async def test_slow_directories_dont_block_others(temp_dir):
 
 @pytest.mark.asyncio
 async def test_tasks_created_on_demand(temp_dir):
-    """Test that tasks are created on-demand, not all upfront."""
+    """Test that a fixed worker pool is used, not a task per directory."""
     # Create many subdirectories
     num_subdirs = 100
     for i in range(num_subdirs):
@@ -140,36 +142,67 @@ async def test_tasks_created_on_demand(temp_dir):
         max_concurrent_subdirs=10,  # Limit to 10 concurrent
     )
 
-    # Track when _process_subdirs_with_constant_concurrency is called
-    # and how many tasks are active at different times
-    max_tasks_seen = 0
-    task_counts = []
-
-    original_method = purger._process_subdirs_with_constant_concurrency
-
-    async def tracked_method(subdirs):
-        # Count how many tasks are created
-        # The method should never create more than max_concurrent_subdirs at once
-        nonlocal max_tasks_seen, task_counts
+    # Record which tasks scan directories
+    scanning_tasks = set()
+    original_scan = purger.scan_directory
 
-        # Call original and track task creation
-        # We can't easily track internal task creation, but we can verify
-        # the method completes successfully
-        await original_method(subdirs)
-        # If we got here without OOM, tasks were likely created on-demand
+    async def tracked_scan(directory: str):
+        scanning_tasks.add(asyncio.current_task())
+        await original_scan(directory)
 
-    purger._process_subdirs_with_constant_concurrency = tracked_method
+    purger.scan_directory = tracked_scan
 
     await purger.purge()
 
     # Verify all subdirectories were scanned
     assert purger.stats["dirs_scanned"] == num_subdirs + 1
 
+    # Directories are scanned by the worker pool (+1 for the initial purge() call),
+    # not by a task per directory
+    assert len(scanning_tasks) <= purger.max_concurrent_subdirs + 1, (
+        f"Expected at most {purger.max_concurrent_subdirs + 1} scanning tasks, saw {len(scanning_tasks)}"
+    )
+
     # Memory should be bounded (if tasks were created all upfront, memory would spike)
     peak_memory = purger.stats.get("peak_memory_mb", 0)
     assert peak_memory < 500, f"Memory should be bounded, got {peak_memory}MB"
 
 
+@pytest.mark.asyncio
+async def test_pending_directories_stay_depth_bounded(temp_dir):
+    """Test that depth-first traversal keeps the directory queue far below the tree's width."""
+    fan_out = 10
+    for i in range(fan_out):
+        for j in range(fan_out):
+            for k in range(fan_out):
+                (temp_dir / f"a{i}" / f"b{j}" / f"c{k}").mkdir(parents=True)
+
+    purger = AsyncEFSPurger(
+        root_path=str(temp_dir),
+        max_age_days=30,
+        dry_run=True,
+        max_concurrent_subdirs=4,
+    )
+
+    peak_pending = 0
+    original_scan = purger.scan_directory
+
+    async def tracked_scan(directory: str):
+        nonlocal peak_pending
+        if purger._dir_queue is not None:
+            peak_pending = max(peak_pending, purger._dir_queue.qsize())
+        await original_scan(directory)
+
+    purger.scan_directory = tracked_scan
+
+    await purger.purge()
+
+    assert purger.stats["dirs_scanned"] == 1 + fan_out + fan_out**2 + fan_out**3
+    # Breadth-first would queue all 1000 leaves at once; depth-first holds roughly
+    # one level's siblings per level per worker
+    assert peak_pending <= 3 * fan_out * purger.max_concurrent_subdirs, f"Peak pending dirs: {peak_pending}"
+
+
 @pytest.mark.asyncio
 async def test_memory_bounded_with_many_subdirs(temp_dir):
     """Test that memory is bounded even with many subdirectories."""
@@ -207,7 +240,7 @@ async def test_deep_directory_tree_memory_safety(temp_dir):
     IMPORTANT: This test uses 40×40×40 (65,641 dirs) for reasonable CI runtime.
 
     Before committing changes to subdirectory concurrency logic (especially
-    _process_subdirs_with_constant_concurrency or scan_directory), please test
+    _scan_tree or scan_directory), please test
     manually with 80×80×80 (518,481 dirs) to ensure no deadlock or memory issues:
 
         # Change range(3) to use 80 dirs per level
@@ -283,8 +316,8 @@ async def test_deep_directory_tree_memory_safety(temp_dir):
     # Simple progress tracking without background task
     original_update = purger.update_stats
 
-    async def tracked_update(**kwargs):
-        result = await original_update(**kwargs)
+    def tracked_update(**kwargs):
+        result = original_update(**kwargs)
         if "dirs_scanned" in kwargs:
             print(
                 f"  [PROGRESS] dirs_scanned={purger.stats['dirs_scanned']}, "
@@ -349,7 +382,7 @@ async def test_hybrid_approach_maintains_concurrency(temp_dir):
 
     original_scan = purger.scan_directory
 
-    async def tracked_scan(directory: Path):
+    async def tracked_scan(directory: str):
         nonlocal max_concurrent
         async with purger.active_directories_lock:
             current_count = len(purger.active_directories)
@@ -380,7 +413,7 @@ async def test_hybrid_approach_maintains_concurrency(temp_dir):
 
 @pytest.mark.asyncio
 async def test_subdir_semaphore_limits_concurrency(temp_dir):
-    """Test that subdir_semaphore properly limits concurrency."""
+    """Test that the directory worker pool properly limits concurrency."""
     # Create many subdirectories
     num_subdirs = 30
     for i in range(num_subdirs):
@@ -401,7 +434,7 @@ async def test_subdir_semaphore_limits_concurrency(temp_dir):
 
     original_scan = purger.scan_directory
 
-    async def tracked_scan(directory: Path):
+    async def tracked_scan(directory: str):
         nonlocal max_concurrent_seen
         async with purger.active_directories_lock:
             current_count = len(purger.active_directories)